@@ -20,9 +20,9 @@ Unlike VisualNxGUI.py, **ScaleNxGUI.py** have a batch processing capabilities.
 File formats
 ------------
 
-Input: PNG, PPM, PGM, PBM.
+Input: PNG, PPM, PGM, PBM, PAM.
 
-Output: PNG, PPM, PGM.
+Output: PNG, PPM, PGM, PBM, PAM.
 
 History:
 --------
@@ -40,6 +40,54 @@ added to GUI; preferences may be saved/loaded to/from file.
 
 26.05.09.09 Internal GUI code changes to facilitate further development.
 
+26.10.19.10 Peak memory per stage (reading, scaling, writing) reported
+for single file in info string, and for batch as per-file results,
+summarized in info string.
+
+26.10.19.11 Preflight memory estimate; scaling that would not fit into
+available memory is refused, for batch - on per-file basis.
+
+26.10.19.12 PNG scanline filter option (none, sub, up, average, paeth
+or adaptive) added to single file and batch saving preferences.
+
+26.10.19.13 RGB and RGBA PNG with 256 colors or less are saved
+as indexed color, reducing file size.
+
+26.10.19.14 Batch processing of indexed color PNG scales palette indices
+and keeps original palette, without expanding to RGB.
+
+26.10.19.15 Single file PNG compression runs on all CPU cores.
+
+26.10.19.16 PNG compression profiles (fastest, balanced, smallest) added
+to compression options; profile sets zlib level and strategy along with
+PNG filter, overriding filter option. Batch default is now balanced.
+
+26.10.19.17 Memory preflight reads file header only, refusing big images
+before reading them. Batch starts with biggest files, so that one big file
+does not stretch batch processing at the end.
+
+26.10.19.18 Batch scales binary PPM and PGM too big for memory
+row by row, instead of refusing them.
+
+26.10.19.19 PBM scaling result may be saved as PBM; batch processes
+PBM as well, keeping it 1 bit (ASCII PBM is saved as binary).
+
+26.10.19.20 Batch row by row scaling of PPM and PGM too big for memory
+extended to ASCII files.
+
+26.10.19.21 PAM (P7) reading and writing, for single file and batch;
+unlike PPM, PAM keeps alpha, and unlike PNG, needs no compression.
+
+26.10.19.22 Single binary PPM, PGM or PAM file too big for memory
+is scaled in bands on all CPU cores, each band written straight into
+result file, instead of being refused.
+
+26.10.19.23 Memory preflight skipped where available memory is unknown
+(e.g. macOS), instead of refusing or streaming ordinary images.
+
+26.10.19.24 Batch memory preflight checks every file against its worker
+share of available memory, since biggest files are scaled at once.
+
 ----
 Main site: `The Toad's Slimy Mudhole`_
 
@@ -61,22 +109,53 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2025-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '26.5.9.9'
+__version__ = '26.10.19.24'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
 
 from json import dump, load
-from multiprocessing import Pool, freeze_support
+from multiprocessing import Pool, cpu_count, freeze_support
 from pathlib import Path
 from time import ctime, time
 from tkinter import Button, Frame, Label, LabelFrame, OptionMenu, StringVar, Tk
 from tkinter.filedialog import askdirectory, askopenfilename, asksaveasfilename
 
-from pypng import list2png, png2list
-from pypnm import list2pnm, pnm2list
+from memwatch import PeakMeter, available, report, rss
+from pypng import PROFILES, list2png, png2list, png_probe
+from pypnm import PnmImage, band2pnm, list2pam, list2pbm, list2pnm, pnm2list, pnm_allocate, pnm_probe, pnm_rows, rows2pam, rows2pnm
+
+from scalenx import estimate, scaleNx, scaleNx_rows  # Configurable ScaleNx as of 2026.2.12.14
+
+# ↓ PNG filter names for preferences, in PNG filter type order
+PNG_FILTERS = ('none', 'sub', 'up', 'average', 'paeth', 'adaptive')
+
+# ↓ PNG compression choices for preferences: zlib levels, then profiles
+PNG_DEFLATIONS = (*range(10), *PROFILES)
+
+
+def FilterType(name: str) -> int | str:
+    """Convert PNG filter name from preferences to ``png.Writer`` ``filter_type``."""
+
+    return 'adaptive' if name == 'adaptive' else PNG_FILTERS.index(name)
 
-from scalenx import scaleNx  # Configurable ScaleNx as of 2026.2.12.14
+
+def Deflation(value: str) -> int | str:
+    """Convert PNG compression from UI string to preferences value, either zlib level or profile name."""
+
+    return int(value) if value.isdigit() else value
+
+
+def PngOptions(deflation: int | str, filter_name: str) -> dict[str, int | str]:
+    """Convert PNG compression and filter preferences to ``png.Writer`` options.
+
+    Compression profile sets filter as well, overriding ``filter_name``.
+
+    """
+
+    if deflation in PROFILES:
+        return PROFILES[deflation].copy()
+    return {'compression': deflation, 'filter_type': FilterType(filter_name)}
 
 
 def DisMiss(event=None) -> None:
@@ -124,6 +203,60 @@ def UIBusy() -> None:
     sortir.update()
 
 
+def Fits(X: int, Y: int, Z: int, bitdepth: int, size: int, sfx: bool, budget: int | None = None) -> tuple[bool, int]:
+    """Preflight check whether scaling fits into memory.
+
+    Arguments:
+        X, Y, Z: source image dimensions;
+        bitdepth: source image bits per channel;
+        size: scale size, either 2 or 3;
+        sfx: use either sfx or classic scaler version;
+        budget: memory available to this process, bytes, *e.g.* its share
+            of available memory for pool worker; None for all available memory.
+
+    Returns:
+        whether expected peak memory fits into memory currently held
+        by the process plus memory available (always True if available
+        memory is unknown), and expected peak memory, bytes.
+
+    """
+
+    X_new, Y_new, memory_needed, seconds = estimate(X, Y, Z, bitdepth, size, sfx, engine='auto')
+    free = available() if budget is None else budget
+    if not free:
+        return True, memory_needed  # Available memory unknown, nothing to check against
+    return memory_needed < rss() + free, memory_needed
+
+
+def Probe(filename: str, indexed: bool = False) -> tuple[int, int, int, int]:
+    """Read image file header only.
+
+    Arguments:
+        filename: PNG or PNM file name;
+        indexed: read indexed color PNG as palette indices, as batch does.
+
+    Returns:
+        source image dimensions X, Y, Z and bits per channel.
+
+    """
+
+    if Path(filename).suffix.lower() == '.png':
+        X, Y, Z, maxcolors, info = png_probe(filename, indexed)
+        return X, Y, Z, info['bitdepth']
+    X, Y, Z, maxcolors = pnm_probe(filename)
+    return X, Y, Z, 16 if maxcolors > 255 else 8
+
+
+def Cost(filename: Path, size: int, sfx: bool) -> float:
+    """Expected scaling time of a file from its header, seconds; 0 for unreadable file."""
+
+    try:
+        X, Y, Z, bitdepth = Probe(str(filename), indexed=True)
+    except Exception:
+        return 0.0  # Failed files are skipped by workers anyway
+    return estimate(X, Y, Z, bitdepth, size, sfx, engine='auto')[3]
+
+
 def FileNx(size: int, sfx: bool) -> None:
     """Single file ScaleNx with variable N and method.
 
@@ -140,9 +273,9 @@ def FileNx(size: int, sfx: bool) -> None:
     sourcefilename = askopenfilename(
         title=f'Open image file to Scale{size}x{"SFX" if sfx else ""}',
         filetypes=[
-            ('Supported formats', '.png .ppm .pgm .pbm'),
+            ('Supported formats', '.png .ppm .pgm .pbm .pam'),
             ('Portable network graphics', '.png'),
-            ('Portable network map', '.ppm .pgm .pbm'),
+            ('Portable network map', '.ppm .pgm .pbm .pam'),
         ],
     )
     if sourcefilename == '':
@@ -151,23 +284,44 @@ def FileNx(size: int, sfx: bool) -> None:
 
     UIBusy()
 
-    if Path(sourcefilename).suffix.lower() == '.png':
-        # ↓ Reading image as list
-        X, Y, Z, maxcolors, image3d, info = png2list(sourcefilename)
+    # ↓ Refusing to scale if result will not fit into memory,
+    #   before reading anything but file header
+    fits, memory_needed = Fits(*Probe(sourcefilename), size, sfx)
+    if not fits:
+        with open(sourcefilename, 'rb') as file:
+            magic = file.read(2)
+        if magic in (b'P6', b'P5', b'P7'):
+            # ↓ Binary PNM is scaled in bands on all CPU cores instead
+            FileNxBands(sourcefilename, magic, size, sfx)
+            return None
+        UINormal()
+        info_string.config(text=f'Refused: Scale{size}x needs about {memory_needed / 1048576:.0f} Mb')
+        return None
+
+    # ↓ Peak memory per stage, bytes
+    memory = {}
 
-    elif Path(sourcefilename).suffix.lower() in ('.ppm', '.pgm', '.pbm'):
-        # ↓ Reading image as list
-        X, Y, Z, maxcolors, image3d = pnm2list(sourcefilename)
-        # ↓ Creating dummy info for PyPNG
-        info = {}
-        # ↓ Fixing color mode. The rest is fixed with pnglpng since ver. 25.01.07.
-        info['bitdepth'] = 16 if maxcolors > 255 else 8
+    with PeakMeter() as meter:
+        if Path(sourcefilename).suffix.lower() == '.png':
+            # ↓ Reading image as list
+            X, Y, Z, maxcolors, image3d, info = png2list(sourcefilename)
 
-    else:
-        raise ValueError('Extension not recognized')
+        elif Path(sourcefilename).suffix.lower() in ('.ppm', '.pgm', '.pbm', '.pam'):
+            # ↓ Reading image as list
+            X, Y, Z, maxcolors, image3d = pnm2list(sourcefilename)
+            # ↓ Creating dummy info for PyPNG
+            info = {}
+            # ↓ Fixing color mode. The rest is fixed with pnglpng since ver. 25.01.07.
+            info['bitdepth'] = 16 if maxcolors > 255 else 8
+
+        else:
+            raise ValueError('Extension not recognized')
+    memory['read'] = meter.peak
 
     # ↓ Scaling image
-    scaled_image = scaleNx(image3d, size, sfx)
+    with PeakMeter() as meter:
+        scaled_image = scaleNx(image3d, size, sfx)
+    memory['scale'] = meter.peak
 
     # ↓ Fixing resolution to match original print size.
     #   If no pHYs found in original, 96 ppi is assumed as original value.
@@ -180,14 +334,19 @@ def FileNx(size: int, sfx: bool) -> None:
     info['physical'] = [size * x_pixels_per_unit, size * y_pixels_per_unit, unit_is_meter]
     # ↑ Resolution changed
 
-    # ↓ Explicitly setting compression for a single file processing
-    info['compression'] = prefs['single_deflation']
+    # ↓ Explicitly setting compression and filter for a single file processing
+    info |= PngOptions(prefs['single_deflation'], prefs['single_filter'])
+    # ↓ Compressing on all CPU cores; batch is parallel per file instead
+    info['workers'] = 0
 
     # ↓ Adjusting "Save as" formats to be displayed
     #   according to bitdepth and source extension
     src_extension = Path(sourcefilename).suffix.lower()
     if Z == 1:
-        if src_extension in ('.pgm', '.pbm', '.pnm'):
+        if src_extension == '.pbm':
+            format = [('Portable bit map', '.pbm'), ('Portable grey map', '.pgm'), ('Portable network graphics', '.png')]
+            proposed_name = f'{Path(sourcefilename).stem}_{size}x.pbm'
+        elif src_extension in ('.pgm', '.pnm'):
             format = [('Portable grey map', '.pgm'), ('Portable network graphics', '.png')]
             proposed_name = f'{Path(sourcefilename).stem}_{size}x.pgm'
         else:
@@ -203,6 +362,12 @@ def FileNx(size: int, sfx: bool) -> None:
     else:
         format = [('Portable network graphics', '.png')]
         proposed_name = f'{Path(sourcefilename).stem}_{size}x.png'
+    # ↓ PAM keeps any color mode, alpha included
+    if src_extension == '.pam':
+        format.insert(0, ('Portable arbitrary map', '.pam'))
+        proposed_name = f'{Path(sourcefilename).stem}_{size}x.pam'
+    else:
+        format.append(('Portable arbitrary map', '.pam'))
 
     UIWaiting()
 
@@ -219,32 +384,138 @@ def FileNx(size: int, sfx: bool) -> None:
         return None
     UIBusy()
 
-    if Path(resultfilename).suffix.lower() == '.png':
-        list2png(resultfilename, scaled_image, info)
-    elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm'):
-        list2pnm(resultfilename, scaled_image, maxcolors, bin=prefs['single_binarity'])
+    with PeakMeter() as meter:
+        if Path(resultfilename).suffix.lower() == '.png':
+            list2png(resultfilename, scaled_image, info, indexed=True)
+        elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm'):
+            list2pnm(resultfilename, scaled_image, maxcolors, bin=prefs['single_binarity'])
+        elif Path(resultfilename).suffix.lower() == '.pbm':
+            list2pbm(resultfilename, scaled_image, maxcolors)
+        elif Path(resultfilename).suffix.lower() == '.pam':
+            list2pam(resultfilename, scaled_image, maxcolors)
+    memory['write'] = meter.peak
+    UINormal()
+    # ↓ Showing peak memory until mouse leaves info string
+    info_string.config(text=f'Peak memory: {report(memory)}')
+
+
+def scale_band_pnm(oldfile: str, newfile: str, top: int, bottom: int, size: int, sfx: bool) -> int:
+    """Function upscales band of rows of binary PNM file into preallocated result file.
+
+    Arguments:
+        oldfile: source binary PNM file name;
+        newfile: result file name, created by ``pnm_allocate``;
+        top, bottom: source rows band to scale, bottom excluded;
+        size: scale size, either 2 or 3;
+        sfx: use either sfx or classic scaler version.
+
+    Returns:
+        peak memory, bytes.
+
+    """
+
+    # ↓ Result rows depend on source rows that far above and below
+    context = 2 if sfx else 1
+    with PeakMeter() as meter:
+        with PnmImage(oldfile) as image:
+            start, stop = max(0, top - context), min(image.Y, bottom + context)
+            band = list(image.rows(start, stop))
+        scaled_band = scaleNx(band, size, sfx)
+        # ↓ Context rows are scaled for neighbourhood only, dropping them
+        band2pnm(newfile, top * size, scaled_band[(top - start) * size : (bottom - start) * size])
+    return meter.peak
+
+
+def FileNxBands(sourcefilename: str, magic: bytes, size: int, sfx: bool) -> None:
+    """Single binary PNM file too big for memory, scaled in bands on all CPU cores.
+
+    Bands are written by workers straight into preallocated result file,
+    so neither the whole source nor the whole result is ever held in memory.
+
+    Arguments:
+        sourcefilename: source binary PNM file name;
+        magic: source file format, b'P6', b'P5' or b'P7';
+        size: scale size, either 2 or 3;
+        sfx: use either sfx or classic scaler version.
+
+    """
+
+    X, Y, Z, maxcolors = pnm_probe(sourcefilename)
+    bitdepth = 16 if maxcolors > 255 else 8
+
+    # ↓ Result keeps source format
+    if magic == b'P7':
+        format = [('Portable arbitrary map', '.pam')]
+    elif magic == b'P6':
+        format = [('Portable pixel map', '.ppm')]
+    else:
+        format = [('Portable grey map', '.pgm')]
+
+    UIWaiting()
+    resultfilename = asksaveasfilename(
+        title=f'Save {size}x image file',
+        filetypes=format,
+        defaultextension=format[0][1],
+        initialdir=Path(sourcefilename).parent,
+        initialfile=f'{Path(sourcefilename).stem}_{size}x{format[0][1]}',
+    )
+    if resultfilename == '':
+        UINormal()
+        return None
+    UIBusy()
+
+    # ↓ Halving band height until all workers fit into memory together
+    workers = cpu_count() or 1
+    band = -(-Y // workers)  # Rounded up
+    free = available()  # 0 if unknown, then bands are not limited
+    while free and band > 16 and workers * estimate(X, band + 4, Z, bitdepth, size, sfx, engine='auto')[2] > free:
+        band = -(-band // 2)
+
+    pnm_allocate(resultfilename, size * X, size * Y, Z, maxcolors, pam=magic == b'P7')
+    with Pool(workers) as bandpool:
+        peaks = bandpool.starmap(
+            scale_band_pnm,
+            ((sourcefilename, resultfilename, top, min(top + band, Y), size, sfx) for top in range(0, Y, band)),
+        )
+
     UINormal()
+    info_string.config(text=f'{len(peaks)} bands on {workers} processes, peak memory per process {max(peaks) / 1048576:.1f} Mb')
 
 
-def scale_file_png(runningfilename: Path, size: int, sfx: bool, compression: int = 3) -> None:
+def scale_file_png(runningfilename: Path, size: int, sfx: bool, png_options: dict[str, int | str], budget: int | None = None) -> tuple[str, dict[str, int]]:
     """Function upscales one PNG file and keeps quite.
 
     Arguments:
         runningfilename: name of file to process;
         size: scale size, either 2 or 3;
         sfx: use either sfx or classic scaler version;
-        compression: zlib deflate setting.
+        png_options: ``png.Writer`` compression and filter options;
+        budget: memory share of pool worker, bytes, see ``Fits``.
+
+    Returns:
+        file name and dictionary of peak memory per stage, bytes;
+        for file refused to scale, ``{'estimate': expected peak memory}``.
 
     """
 
     oldfile = str(runningfilename)
     newfile = oldfile  # Previous version used backup newfile = oldfile + '.2x.png'
+    memory = {}
+
+    # ↓ Refusing to scale if result will not fit into memory, reading header only
+    fits, memory_needed = Fits(*Probe(oldfile, indexed=True), size, sfx, budget)
+    if not fits:
+        return oldfile, {'estimate': memory_needed}
 
     # ↓ Reading image as list
-    X, Y, Z, maxcolors, image3d, info = png2list(oldfile)
+    with PeakMeter() as meter:
+        X, Y, Z, maxcolors, image3d, info = png2list(oldfile, indexed=True)
+    memory['read'] = meter.peak
 
     # ↓ Scaling image
-    scaled_image = scaleNx(image3d, size, sfx)
+    with PeakMeter() as meter:
+        scaled_image = scaleNx(image3d, size, sfx)
+    memory['scale'] = meter.peak
 
     # ↓ Fixing resolution to match original print size.
     #   If no pHYs found in original, 96 ppi is assumed as original value.
@@ -257,35 +528,78 @@ def scale_file_png(runningfilename: Path, size: int, sfx: bool, compression: int
     info['physical'] = [size * x_pixels_per_unit, size * y_pixels_per_unit, unit_is_meter]
     # ↑ Resolution changed
 
-    # ↓ Explicitly setting compression for batch processing
-    info['compression'] = compression
+    # ↓ Explicitly setting compression and filter for batch processing
+    info |= png_options
 
     # ↓ Writing PNG file
-    list2png(newfile, scaled_image, info)
+    with PeakMeter() as meter:
+        list2png(newfile, scaled_image, info, indexed=True)
+    memory['write'] = meter.peak
 
+    return oldfile, memory
 
-def scale_file_pnm(runningfilename: Path, size: int, sfx: bool, bin: bool = True) -> None:
+
+def scale_file_pnm(runningfilename: Path, size: int, sfx: bool, bin: bool = True, budget: int | None = None) -> tuple[str, dict[str, int]]:
     """Function upscales one PNM file and keeps quite.
 
     Arguments:
         runningfilename: name of file to process;
         size: scale size, either 2 or 3;
         sfx: use either sfx or classic scaler version;
-        bin: whether write binary PNM or ASCII.
+        bin: whether write binary PNM or ASCII;
+        budget: memory share of pool worker, bytes, see ``Fits``.
+
+    Returns:
+        file name and dictionary of peak memory per stage, bytes;
+        for file too big for memory, either ``{'stream': peak memory}``
+        if scaled row by row, or ``{'estimate': expected peak memory}``
+        if refused.
 
     """
 
     oldfile = str(runningfilename)
     newfile = oldfile  # Overwrite!
+    memory = {}
+
+    # ↓ Streaming image too big for memory, if possible, reading header only
+    fits, memory_needed = Fits(*Probe(oldfile), size, sfx, budget)
+    if not fits:
+        with open(oldfile, 'rb') as file:
+            magic = file.read(2)
+        streamable = magic == b'P7' or (bin and magic in (b'P6', b'P5', b'P3', b'P2'))
+        if not streamable:
+            return oldfile, {'estimate': memory_needed}
+        # ↓ Source is mapped while being read, result goes to temporary file
+        tempfile = Path(oldfile).with_name(f'{Path(oldfile).name}.tmp')
+        rows2file = rows2pam if magic == b'P7' else rows2pnm
+        with PeakMeter() as meter:
+            X, Y, Z, maxcolors, rows = pnm_rows(oldfile)
+            rows2file(str(tempfile), size * X, size * Y, Z, maxcolors, scaleNx_rows(rows, size, sfx))
+        tempfile.replace(newfile)
+        memory['stream'] = meter.peak
+        return oldfile, memory
 
     # ↓ Reading image as list
-    X, Y, Z, maxcolors, image3d = pnm2list(oldfile)
+    with PeakMeter() as meter:
+        X, Y, Z, maxcolors, image3d = pnm2list(oldfile)
+    memory['read'] = meter.peak
 
     # ↓ Scaling image
-    scaled_image = scaleNx(image3d, size, sfx)
+    with PeakMeter() as meter:
+        scaled_image = scaleNx(image3d, size, sfx)
+    memory['scale'] = meter.peak
+
+    # ↓ Writing PNM file, bilevel stays bilevel
+    with PeakMeter() as meter:
+        if Path(oldfile).suffix.lower() == '.pbm':
+            list2pbm(newfile, scaled_image, maxcolors)
+        elif Path(oldfile).suffix.lower() == '.pam':
+            list2pam(newfile, scaled_image, maxcolors)
+        else:
+            list2pnm(newfile, scaled_image, maxcolors, bin)
+    memory['write'] = meter.peak
 
-    # ↓ Writing PNM file
-    list2pnm(newfile, scaled_image, maxcolors, bin)
+    return oldfile, memory
 
 
 def FolderNx(size: int, sfx: bool) -> None:
@@ -312,39 +626,66 @@ def FolderNx(size: int, sfx: bool) -> None:
 
     # ↓ Reading global prefs dict and converting some values to local vars
     #   to transmit to pool functions since pool don't digest globals.
-    compression = prefs['batch_deflation']
+    png_options = PngOptions(prefs['batch_deflation'], prefs['batch_filter'])
     bin = prefs['batch_binarity']
 
-    # ↓ Creating pool
-    scalepool = Pool()
+    # ↓ Creating pool. Biggest files start at once, so every worker
+    #   gets its share of available memory (0 if unknown) to check against.
+    workers = cpu_count() or 1
+    scalepool = Pool(workers)
+    budget = available() // workers
+    # ↓ Per-file results, each returning (filename, {stage: peak memory})
+    results = []
+
+    # ↓ Supported files, biggest first: workers taking small files
+    #   at the end finish close together, unlike big files taken last
+    filenames = [filename for filename in path.rglob('*.*') if filename.suffix.lower() in ('.png', '.ppm', '.pgm', '.pbm', '.pam')]
+    filenames.sort(key=lambda filename: Cost(filename, size, sfx), reverse=True)
 
     # ↓ Feeding the pool (no pun!)
-    for runningfilename in path.rglob('*.*'):
+    for runningfilename in filenames:
         if runningfilename.suffix.lower() == '.png':
-            scalepool.apply_async(
+            result = scalepool.apply_async(
                 scale_file_png,
                 args=(
                     runningfilename,
                     size,
                     sfx,
-                    compression,
+                    png_options,
+                    budget,
                 ),
             )
-        if runningfilename.suffix.lower() in ('.ppm', '.pgm'):
-            scalepool.apply_async(
+            results.append(result)
+        if runningfilename.suffix.lower() in ('.ppm', '.pgm', '.pbm', '.pam'):
+            result = scalepool.apply_async(
                 scale_file_pnm,
                 args=(
                     runningfilename,
                     size,
                     sfx,
                     bin,
+                    budget,
                 ),
             )
+            results.append(result)
 
     # ↓ Everything fed into the pool, waiting and closing
     scalepool.close()
     scalepool.join()
+
+    # ↓ Collecting per-file peak memory; the hungriest file defines
+    #   memory per worker, required to size worker count.
+    #   Failed files are skipped silently, as before.
+    file_memory = dict(result.get() for result in results if result.successful())
+    # ↓ Refused files only have memory estimate, not actual stages
+    refused = [filename for filename in file_memory if 'estimate' in file_memory[filename]]
+    scaled = [filename for filename in file_memory if 'estimate' not in file_memory[filename]]
     UINormal()
+    if scaled:
+        hungriest = max(scaled, key=lambda filename: max(file_memory[filename].values()))
+        info_string.config(text=f'{len(scaled)} files, {len(refused)} refused; worst {Path(hungriest).name}: {report(file_memory[hungriest])}')
+    elif refused:
+        info_string.config(text=f'All {len(refused)} files refused as too big')
 
 
 def IniFileLoad(event=None) -> dict:
@@ -358,9 +699,11 @@ def IniFileLoad(event=None) -> dict:
         'version': __version__,
         'time': ctime(time()),
         # ↓ now necessary fields
-        'batch_deflation': 3,
+        'batch_deflation': 'balanced',
+        'batch_filter': 'none',
         'batch_binarity': True,
         'single_deflation': 9,
+        'single_filter': 'none',
         'single_binarity': True,
     }
     # ↓ Checking external preference file existence,
@@ -378,23 +721,31 @@ def IniFileLoad(event=None) -> dict:
         or ('batch_binarity' not in prefs)
         or ('single_binarity' not in prefs)
         or ('single_deflation' not in prefs)
-        or (type(prefs['batch_deflation']) is not int)
-        or (type(prefs['single_deflation']) is not int)
+        or (type(prefs['batch_deflation']) not in (int, str))
+        or (type(prefs['single_deflation']) not in (int, str))
         or (type(prefs['batch_binarity']) is not bool)
         or (type(prefs['single_binarity']) is not bool)
     ):
         prefs = factory.copy()
-    if prefs['batch_deflation'] not in range(10):
-        prefs['batch_deflation'] = 3
-    if prefs['single_deflation'] not in range(10):
-        prefs['single_deflation'] = 9
+    # ↓ Compression is either zlib level or profile name since 26.10.19.16
+    if prefs['batch_deflation'] not in PNG_DEFLATIONS:
+        prefs['batch_deflation'] = factory['batch_deflation']
+    if prefs['single_deflation'] not in PNG_DEFLATIONS:
+        prefs['single_deflation'] = factory['single_deflation']
+    # ↓ Filter prefs are missing in files saved before 26.10.19.12
+    if prefs.get('batch_filter') not in PNG_FILTERS:
+        prefs['batch_filter'] = factory['batch_filter']
+    if prefs.get('single_filter') not in PNG_FILTERS:
+        prefs['single_filter'] = factory['single_filter']
     # ↓ Feeding values to UI
     png_single.set(str(prefs['single_deflation']))
+    filter_single.set(prefs['single_filter'])
     pnm_single.set('bin' if prefs['single_binarity'] else 'ascii')
     png_batch.set(str(prefs['batch_deflation']))
+    filter_batch.set(prefs['batch_filter'])
     pnm_batch.set('bin' if prefs['batch_binarity'] else 'ascii')
     # ↓ Changing status
-    info_string.config(text=f'Batch comp:{prefs["batch_deflation"]} bin:{prefs["batch_binarity"]}; Single comp:{prefs["single_deflation"]} bin:{prefs["single_binarity"]} loaded')
+    info_string.config(text=f'Batch comp:{prefs["batch_deflation"]} filt:{prefs["batch_filter"]} bin:{prefs["batch_binarity"]}; Single comp:{prefs["single_deflation"]} filt:{prefs["single_filter"]} bin:{prefs["single_binarity"]} loaded')
     info_string.focus_set()
     sortir.update()
 
@@ -423,9 +774,11 @@ def IniFileSave(event=None) -> None:
 def FormatPrefs() -> None:
     """Reading file output settings from UI and pushing it into global prefs dict."""
 
-    prefs['single_deflation'] = int(png_single.get())
+    prefs['single_deflation'] = Deflation(png_single.get())
+    prefs['single_filter'] = filter_single.get()
     prefs['single_binarity'] = False if pnm_single.get() == 'ascii' else True
-    prefs['batch_deflation'] = int(png_batch.get())
+    prefs['batch_deflation'] = Deflation(png_batch.get())
+    prefs['batch_filter'] = filter_batch.get()
     prefs['batch_binarity'] = False if pnm_batch.get() == 'ascii' else True
 
 
@@ -588,14 +941,27 @@ if __name__ == '__main__':
     options_left_png = OptionMenu(
         options_left,
         png_single,
-        *['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'],
+        *map(str, PNG_DEFLATIONS),
     )
     options_left_png.grid(row=0, column=1, sticky='e')
-    options_left_png.configure(font=option['font_menu'], width=1, relief=option['relief'], activebackground=option['activebackground'])
+    options_left_png.configure(font=option['font_menu'], width=8, relief=option['relief'], activebackground=option['activebackground'])
     options_left_png['menu'].configure(font=options_left_png['font'])
 
+    options_left_filter_label = Label(options_left, text='PNG Filter:', font=option['font_label'])
+    options_left_filter_label.grid(row=1, column=0, sticky='w')
+
+    filter_single = StringVar(value='none')
+    options_left_filter = OptionMenu(
+        options_left,
+        filter_single,
+        *PNG_FILTERS,
+    )
+    options_left_filter.grid(row=1, column=1, sticky='e')
+    options_left_filter.configure(font=option['font_menu'], width=8, relief=option['relief'], activebackground=option['activebackground'])
+    options_left_filter['menu'].configure(font=options_left_filter['font'])
+
     options_left_pnm_label = Label(options_left, text='PNM Type:', font=('helvetica', 10))
-    options_left_pnm_label.grid(row=1, column=0, sticky='w')
+    options_left_pnm_label.grid(row=2, column=0, sticky='w')
 
     pnm_single = StringVar(value='bin')
     options_left_pnm = OptionMenu(
@@ -603,7 +969,7 @@ if __name__ == '__main__':
         pnm_single,
         *['bin', 'ascii'],
     )
-    options_left_pnm.grid(row=1, column=1, sticky='e')
+    options_left_pnm.grid(row=2, column=1, sticky='e')
     options_left_pnm.configure(font=option['font_menu'], width=5, relief=option['relief'], activebackground=option['activebackground'])
     options_left_pnm['menu'].configure(font=options_left_pnm['font'])
 
@@ -614,18 +980,31 @@ if __name__ == '__main__':
     options_right_png_label = Label(options_right, text='PNG Compression:', font=option['font_label'])
     options_right_png_label.grid(row=0, column=0, sticky='w')
 
-    png_batch = StringVar(value=3)
+    png_batch = StringVar(value='balanced')
     options_right_png = OptionMenu(
         options_right,
         png_batch,
-        *['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'],
+        *map(str, PNG_DEFLATIONS),
     )
     options_right_png.grid(row=0, column=1, sticky='e')
-    options_right_png.configure(font=option['font_menu'], width=1, relief=option['relief'], activebackground=option['activebackground'])
+    options_right_png.configure(font=option['font_menu'], width=8, relief=option['relief'], activebackground=option['activebackground'])
     options_right_png['menu'].configure(font=options_right_png['font'])
 
+    options_right_filter_label = Label(options_right, text='PNG Filter:', font=option['font_label'])
+    options_right_filter_label.grid(row=1, column=0, sticky='w')
+
+    filter_batch = StringVar(value='none')
+    options_right_filter = OptionMenu(
+        options_right,
+        filter_batch,
+        *PNG_FILTERS,
+    )
+    options_right_filter.grid(row=1, column=1, sticky='e')
+    options_right_filter.configure(font=option['font_menu'], width=8, relief=option['relief'], activebackground=option['activebackground'])
+    options_right_filter['menu'].configure(font=options_right_filter['font'])
+
     options_right_pnm_label = Label(options_right, text='PNM Type:', font=option['font_label'])
-    options_right_pnm_label.grid(row=1, column=0, sticky='w')
+    options_right_pnm_label.grid(row=2, column=0, sticky='w')
 
     pnm_batch = StringVar(value='bin')
     options_right_pnm = OptionMenu(
@@ -633,7 +1012,7 @@ if __name__ == '__main__':
         pnm_batch,
         *['bin', 'ascii'],
     )
-    options_right_pnm.grid(row=1, column=1, sticky='e')
+    options_right_pnm.grid(row=2, column=1, sticky='e')
     options_right_pnm.configure(font=option['font_menu'], width=5, relief=option['relief'], activebackground=option['activebackground'])
     options_right_pnm['menu'].configure(font=options_right_pnm['font'])
 
@@ -45,6 +45,27 @@ Result may be copied to clipboard on info string *Ctrl+Click*.
 
 26.5.9.9    Internal GUI code changes to facilitate further development.
 
+26.10.19.10 Peak memory per stage (reading, copying, scaling, writing)
+added to info string along with execution time.
+
+26.10.19.11 Preflight memory estimate; scaling that would not fit into
+available memory is refused with a warning instead of exhausting memory.
+
+26.10.19.12 Scaling engine chosen automatically for each image,
+shown in info string along with execution time.
+
+26.10.19.13 RGB and RGBA PNG with 256 colors or less are saved
+as indexed color, reducing file size.
+
+26.10.19.14 PNG compression runs on all CPU cores.
+
+26.10.19.15 Faster preview; 16 bpc images previewed as 8 bpc.
+
+26.10.19.16 Memory preflight skipped where available memory is unknown
+(e.g. macOS), instead of refusing ordinary images.
+
+26.10.19.17 Expected scaling time estimated for the engine actually used.
+
 ----
 Main site: `The Toad's Slimy Mudhole`_
 
@@ -66,7 +87,7 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2025-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '26.5.9.9'
+__version__ = '26.10.19.17'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
@@ -77,12 +98,13 @@ from random import randbytes  # Used for random icon only
 from time import ctime, time
 from tkinter import Button, Frame, Label, Menu, Menubutton, OptionMenu, PhotoImage, StringVar, Tk
 from tkinter.filedialog import askopenfilename, asksaveasfilename
-from tkinter.messagebox import showinfo
+from tkinter.messagebox import showinfo, showwarning
 
+from memwatch import PeakMeter, available, report, rss
 from pypng import list2png, png2list
 from pypnm import list2bin, list2pnm, pnm2list
 
-from scalenx import scaleNx  # Configurable ScaleNx as of 2026.2.11.19
+from scalenx import choose_engine, estimate, scaleNx  # Configurable ScaleNx as of 2026.2.11.19
 
 """ ╔══════════════════════════════════╗
     ║ GUI events and functions thereof ║
@@ -179,7 +201,7 @@ def ShowPreview(preview_choice: PhotoImage, caption: str) -> None:
 def GetSource(event=None) -> None:
     """Open source image and redefine other controls state."""
 
-    global zoom_factor, view_src, is_filtered, is_saved, info_normal, color_mode_str, operation, timing
+    global zoom_factor, view_src, is_filtered, is_saved, info_normal, color_mode_str, operation, timing, memory
     global preview, preview_src, preview_filtered  # preview and copies of preview
     global sourcefilename, X, Y, Z, maxcolors, source_image, info
     global result_image
@@ -206,31 +228,36 @@ def GetSource(event=None) -> None:
     is_filtered = is_saved = False
 
     UIBusy()
+    memory = {}
     start = time()
-    if Path(sourcefilename).suffix.lower() == '.png':
-        # ↓ Reading PNG image as list
-        X, Y, Z, maxcolors, source_image, info = png2list(sourcefilename)
+    with PeakMeter() as meter:
+        if Path(sourcefilename).suffix.lower() == '.png':
+            # ↓ Reading PNG image as list
+            X, Y, Z, maxcolors, source_image, info = png2list(sourcefilename)
+
+        elif Path(sourcefilename).suffix.lower() in ('.ppm', '.pgm', '.pbm', '.pnm'):
+            # ↓ Reading PNM image as list
+            X, Y, Z, maxcolors, source_image = pnm2list(sourcefilename)
+            # ↓ Creating dummy info required to correctly Save As PNG later.
+            #   Fixing color mode, the rest is fixed with pnglpng v. 25.01.07.
+            info = {'bitdepth': 16} if maxcolors > 255 else {'bitdepth': 8}
 
-    elif Path(sourcefilename).suffix.lower() in ('.ppm', '.pgm', '.pbm', '.pnm'):
-        # ↓ Reading PNM image as list
-        X, Y, Z, maxcolors, source_image = pnm2list(sourcefilename)
-        # ↓ Creating dummy info required to correctly Save As PNG later.
-        #   Fixing color mode, the rest is fixed with pnglpng v. 25.01.07.
-        info = {'bitdepth': 16} if maxcolors > 255 else {'bitdepth': 8}
-
-    else:
-        raise ValueError('Extension not recognized')
+        else:
+            raise ValueError('Extension not recognized')
     timing = time() - start
+    memory['read'] = meter.peak
 
     # ↓ Creating deep copy of source 3D list
     #   to avoid accumulating repetitive filtering.
-    result_image = deepcopy(source_image)
+    with PeakMeter() as meter:
+        result_image = deepcopy(source_image)
+    memory['copy'] = meter.peak
 
     """ ┌───────────────┐
         │ Viewing image │
         └───────────────┘ """
     # ↓ Converting list to bytes of PNM-like structure "preview_data" in memory
-    preview_data = list2bin(result_image, maxcolors, show_chessboard=True)
+    preview_data = list2bin(result_image, maxcolors, show_chessboard=True, reduce_depth=True)
     # ↓ Now generating preview from "preview_data" bytes using Tkinter
     preview = PhotoImage(data=preview_data)
     # ↓ Finally the show part
@@ -289,7 +316,7 @@ def GetSource(event=None) -> None:
 def RunFilter(event=None) -> None:
     """Filter image, then preview result."""
 
-    global zoom_factor, view_src, is_filtered, is_saved, info_normal, color_mode_str, operation, timing
+    global zoom_factor, view_src, is_filtered, is_saved, info_normal, color_mode_str, operation, timing, memory
     global preview, preview_filtered
     global X, Y, Z, maxcolors, source_image, info
     global result_image
@@ -315,13 +342,30 @@ def RunFilter(event=None) -> None:
         n = 3
         sfx = True
 
+    if method != 'None':
+        # ↓ Preflight check, refusing to scale if result will not fit into memory
+        engine = choose_engine(source_image, n, sfx)
+        X_new, Y_new, memory_needed, seconds = estimate(X, Y, Z, 16 if maxcolors > 255 else 8, n, sfx, engine)
+        free = available()  # 0 if unknown, then check is skipped
+        if free and memory_needed > rss() + free:
+            UINormal()
+            showwarning(
+                title='Image too big',
+                message=f'{method} result would be {X_new} x {Y_new} px, requiring about {memory_needed / 1048576:.0f} Mb of memory.',
+                detail=f'Only {(rss() + free) / 1048576:.0f} Mb may be used. Expected scaling time {seconds:.0f} sec. Scaling cancelled.',
+            )
+            method_str.set('None')  # Triggers RunFilter again, restoring source view
+            return None
+
     if method == 'None':
         result_image = source_image
     else:
-        operation = 'Scaling'
         start = time()
-        result_image = scaleNx(source_image, n=n, sfx=sfx)
+        operation = f'Scaling ({engine} engine)'
+        with PeakMeter() as meter:
+            result_image = scaleNx(source_image, n=n, sfx=sfx, engine=engine)
         timing = time() - start
+        memory = {'scale': meter.peak}
         if 'physical' in info:  # Fixing resolution to match original print size
             x_pixels_per_unit, y_pixels_per_unit, unit_is_meter = info['physical']
         else:  # Assume 3780 px/meter (96 px/inch) as original
@@ -342,7 +386,7 @@ def RunFilter(event=None) -> None:
         sortir.bind_all('<Control-s>', Save)
 
         # ↓ preview result
-        preview_data = list2bin(result_image, maxcolors, show_chessboard=True)
+        preview_data = list2bin(result_image, maxcolors, show_chessboard=True, reduce_depth=True)
         preview_filtered = PhotoImage(data=preview_data)
 
         ShowPreview(preview_filtered, 'Result')
@@ -483,7 +527,7 @@ def onSave() -> None:
 def Save(event=None) -> None:
     """Once pressed on Save."""
 
-    global is_filtered, is_saved, info_normal, color_mode_str, operation, timing
+    global is_filtered, is_saved, info_normal, color_mode_str, operation, timing, memory
     global source_image, preview_src, preview_filtered
 
     operation = 'Saving'
@@ -495,13 +539,16 @@ def Save(event=None) -> None:
     resultfilename = sourcefilename
     UIBusy()
     start = time()
-    # ↓ Save format choice
-    if Path(resultfilename).suffix.lower() == '.png':
-        info['compression'] = 9  # Explicitly setting compression
-        list2png(resultfilename, result_image, info)  # Writing file
-    elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm', '.pnm'):
-        list2pnm(resultfilename, result_image, maxcolors)  # Writing file
+    with PeakMeter() as meter:
+        # ↓ Save format choice
+        if Path(resultfilename).suffix.lower() == '.png':
+            info['compression'] = 9  # Explicitly setting compression
+            info['workers'] = 0  # Compressing on all CPU cores
+            list2png(resultfilename, result_image, info, indexed=True)  # Writing file
+        elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm', '.pnm'):
+            list2pnm(resultfilename, result_image, maxcolors)  # Writing file
     timing = time() - start
+    memory = {'write': meter.peak}
     # ↓ Flagging image as saved, not filtered
     is_saved = True  # to block future repetitive saving
     is_filtered = False
@@ -512,7 +559,7 @@ def Save(event=None) -> None:
 def SaveAs(event=None) -> None:
     """Once pressed on Save as..."""
 
-    global is_saved, is_filtered, info_normal, color_mode_str, operation, timing
+    global is_saved, is_filtered, info_normal, color_mode_str, operation, timing, memory
     global sourcefilename, resultfilename, source_image, preview_src, preview_filtered
 
     operation = 'Saving'
@@ -569,15 +616,18 @@ def SaveAs(event=None) -> None:
         return None
     UIBusy()
     start = time()
-    # ↓ Save format choice
-    if Path(resultfilename).suffix.lower() == '.png':
-        info['compression'] = 9  # Explicitly setting compression
-        list2png(resultfilename, result_image, info)  # Writing file
-    elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm'):
-        list2pnm(resultfilename, result_image, maxcolors)  # Writing file
-    else:
-        raise ValueError('Extension not recognized')
+    with PeakMeter() as meter:
+        # ↓ Save format choice
+        if Path(resultfilename).suffix.lower() == '.png':
+            info['compression'] = 9  # Explicitly setting compression
+            info['workers'] = 0  # Compressing on all CPU cores
+            list2png(resultfilename, result_image, info, indexed=True)  # Writing file
+        elif Path(resultfilename).suffix.lower() in ('.ppm', '.pgm'):
+            list2pnm(resultfilename, result_image, maxcolors)  # Writing file
+        else:
+            raise ValueError('Extension not recognized')
     timing = time() - start
+    memory = {'write': meter.peak}
     # ↓ Flagging image as saved, not filtered, and disabling "Save"
     is_saved = True  # to block future repetitive saving
     is_filtered = False
@@ -596,6 +646,7 @@ is_filtered = False
 product_name = 'Visual ScaleNx'
 operation = 'Awaiting orders'
 timing = 0
+memory = {}  # Peak memory per stage of last operation, bytes
 
 sortir = Tk()
 
@@ -712,8 +763,8 @@ label_zoom.pack(side='left', anchor='n', padx=2, pady=0, fill='both')
 """ ┌─────────────────────────────────────────────┐
     │ Binding everything that does not need image │
     └────────────────────────────────────────────-┘ """
-# ↓ Info string binding for displaying scaler execution time
-info_string.bind('<Enter>', lambda event=None: info_string.config(text=f'{operation} time: {round(timing, 3)} sec'))
+# ↓ Info string binding for displaying scaler execution time and peak memory
+info_string.bind('<Enter>', lambda event=None: info_string.config(text=f'{operation} time: {round(timing, 3)} sec{"; peak memory: " if memory else ""}{report(memory)}'))
 info_string.bind('<Leave>', lambda event=None: info_string.config(text=info_normal['txt']))
 info_string.bind('<Control-Button-1>', lambda event=None: [sortir.clipboard_clear(), sortir.clipboard_append(f'{timing}\n')])
 # ↓ Double-click image area to "Open..."
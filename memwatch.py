@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+"""
+========
+MemWatch
+========
+----------------------------------------------------
+Process memory accounting for ScaleNx GUI and batch.
+----------------------------------------------------
+
+Overview
+--------
+
+**memwatch** provides cheap peak memory measurement around
+processing stages (reading, scaling, copying, writing) of ScaleNx GUI
+shells and batch workers.
+
+Measurement is based on process resident set size (RSS), sampled by a
+background thread while the stage runs. Unlike ``tracemalloc``, sampling
+does not slow down the measured code noticeably, therefore timing
+shown by GUI remains meaningful.
+
+Functions and classes included are:
+
+- ``rss``: current process resident set size, bytes;
+- ``PeakMeter``: context manager, recording peak RSS
+  while the ``with`` block is executed;
+- ``available``: physical memory available for new allocations, bytes;
+- ``report``: human-readable string of per-stage peaks.
+
+Usage
+-----
+
+::
+
+    from memwatch import PeakMeter
+
+    with PeakMeter() as meter:
+        scaled_image = scaleNx(source_image, n, sfx)
+    print(meter.peak)
+
+where ``meter.peak`` is the peak RSS (bytes) observed during scaling.
+
+.. note:: RSS includes everything the process holds, *i.e.* the figure
+    is a process peak during the stage, not a stage increment.
+    Since Python rarely returns freed memory to the OS, peaks
+    of later stages include leftovers of earlier ones, which is exactly
+    what sizing machines and worker counts requires.
+
+"""
+
+__author__ = 'Ilya Razmanov'
+__copyright__ = '(c) 2026 Ilya Razmanov'
+__credits__ = 'Ilya Razmanov'
+__license__ = 'unlicense'
+__version__ = '26.10.19.10'
+__maintainer__ = 'Ilya Razmanov'
+__email__ = 'ilyarazmanov@gmail.com'
+__status__ = 'Production'
+
+import sys
+from threading import Event, Thread
+
+""" ╔═════╗
+    ║ rss ║
+    ╟─────╢
+    ║ etc ║
+    ╚═════╝ """
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    class _MemoryStatusEx(ctypes.Structure):
+        """MEMORYSTATUSEX structure for GlobalMemoryStatusEx."""
+
+        _fields_ = [
+            ('dwLength', wintypes.DWORD),
+            ('dwMemoryLoad', wintypes.DWORD),
+            ('ullTotalPhys', ctypes.c_ulonglong),
+            ('ullAvailPhys', ctypes.c_ulonglong),
+            ('ullTotalPageFile', ctypes.c_ulonglong),
+            ('ullAvailPageFile', ctypes.c_ulonglong),
+            ('ullTotalVirtual', ctypes.c_ulonglong),
+            ('ullAvailVirtual', ctypes.c_ulonglong),
+            ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+        ]
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        """PROCESS_MEMORY_COUNTERS structure for GetProcessMemoryInfo."""
+
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    _GetCurrentProcess = ctypes.windll.kernel32.GetCurrentProcess
+    _GetCurrentProcess.restype = wintypes.HANDLE
+    _GetProcessMemoryInfo = ctypes.windll.psapi.GetProcessMemoryInfo
+    _GetProcessMemoryInfo.argtypes = (wintypes.HANDLE, ctypes.POINTER(_ProcessMemoryCounters), wintypes.DWORD)
+
+    def rss() -> int:
+        """Return current process working set size, bytes."""
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if not _GetProcessMemoryInfo(_GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return 0
+        return counters.WorkingSetSize
+
+    def available() -> int:
+        """Return physical memory available for new allocations, bytes."""
+
+        status = _MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(status)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return 0
+        return status.ullAvailPhys
+
+else:
+    import os
+
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+    def rss() -> int:
+        """Return current process resident set size, bytes.
+
+        Read from ``/proc/self/statm`` where available; otherwise
+        falls back to process lifetime peak from ``resource``.
+
+        """
+
+        try:
+            with open('/proc/self/statm', 'rb') as statm:
+                return int(statm.read().split()[1]) * _PAGE_SIZE
+        except OSError:
+            import resource
+
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ↓ ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+            return peak if sys.platform == 'darwin' else peak * 1024
+
+    def available() -> int:
+        """Return physical memory available for new allocations, bytes.
+
+        ``MemAvailable`` from ``/proc/meminfo`` where available (includes
+        reclaimable cache); otherwise free physical pages; 0 if unknown.
+
+        """
+
+        try:
+            with open('/proc/meminfo', 'rb') as meminfo:
+                for line in meminfo:
+                    if line.startswith(b'MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * _PAGE_SIZE
+        except (ValueError, OSError):
+            return 0
+
+
+""" ╔═══════════╗
+    ║ PeakMeter ║
+    ╚═══════════╝ """
+
+
+class PeakMeter:
+    """Context manager recording peak process RSS while ``with`` block runs.
+
+    :param float interval: sampling interval, seconds.
+
+    After leaving the ``with`` block, ``peak`` attribute holds
+    the peak RSS, bytes, observed during the block.
+
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.peak = 0
+        self._stop = Event()
+        self._thread = None
+
+    def _sample(self) -> None:
+        """Sampling loop, running in a background thread."""
+
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss())
+
+    def __enter__(self) -> 'PeakMeter':
+        self.peak = rss()
+        self._stop.clear()
+        self._thread = Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss())
+
+
+""" ╔════════╗
+    ║ report ║
+    ╚════════╝ """
+
+
+def report(peaks: dict[str, int]) -> str:
+    """Format ``{stage: peak_bytes}`` dictionary as a short string for info lines."""
+
+    return ', '.join(f'{stage} {peak / 1048576:.1f} Mb' for stage, peak in peaks.items())
+
+
+# ↓ Dummy stub for standalone execution attempt
+if __name__ == '__main__':
+    print('Module to be imported, not run as standalone.')
+    need_help = input('Would you like to read some help (y/n)?')
+    if need_help.startswith(('y', 'Y')):
+        import memwatch
+        help(memwatch)
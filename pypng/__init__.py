@@ -2,13 +2,19 @@
 
 Usage::
 
-    from pypng import list2png, png2list
+    from pypng import PROFILES, array2png, list2png, png2array, png2list, png_probe, png_rows, rows2png
 
 """
 
-__version__ = '26.3.8.312'
+__version__ = '26.10.19.23'
 
-from .pnglpng import list2png, png2list
+from .pnglpng import PROFILES, array2png, list2png, png2array, png2list, png_probe, png_rows, rows2png
 
 png2list = png2list
 list2png = list2png
+png_rows = png_rows
+png_probe = png_probe
+png2array = png2array
+array2png = array2png
+rows2png = rows2png
+PROFILES = PROFILES
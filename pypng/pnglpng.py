@@ -23,7 +23,12 @@ of human origin.
 Functions included are:
 
 - ``png2list``: reading PNG file and returning all data;
+- ``png_rows``: reading PNG file and returning rows generator;
+- ``png_probe``: reading PNG file header only, without image data;
 - ``list2png``: getting data and writing PNG file;
+- ``rows2png``: getting rows one by one and writing PNG file;
+- ``png2array``, ``array2png``: the same as above for flat ``array``
+  instead of nested list, avoiding per-sample Python loops;
 - ``create_image``: creating empty nested 3D list for image representation.
 
 Installation
@@ -43,7 +48,8 @@ for reading data from PNG file, where:
 
 - ``X``, ``Y``, ``Z``: PNG image dimensions (int);
 - ``maxcolors``: number of colors per channel for current image (int),
-  either 1, or 255, or 65535, for 1 bpc, 8 bpc and 16 bpc PNG respectively;
+  either 1, or 3, or 15, or 255, or 65535, for 1, 2, 4, 8 and 16 bpc
+  PNG respectively;
 - ``list_3d``: Y * X * Z list (image) of lists (rows) of lists (pixels) of
   ints (channels), from PNG iDAT;
 - ``info``: dictionary of PNG chunks like resolution etc.,
@@ -54,6 +60,120 @@ and ::
     pnglpng.list2png(out_filename, list_3d, info)
 
 for writing data as listed above to ``out_filename`` PNG.
+``info`` may also contain ``png.Writer`` options like ``compression``
+(zlib level) and ``filter_type`` (scanline filter, 0 to 4 or
+``'adaptive'``; default 0, *i.e.* no filtering) and ``workers``
+(number of threads compressing image data, 0 for one per CPU; default 1).
+With ``pnglpng.list2png(out_filename, list_3d, info, indexed=True)``
+RGB and RGBA images with 256 colors or less are written as indexed color
+PNG, and greyscale images with few levels (like bilevel scans) as 1, 2
+or 4 bpc greyscale PNG, usually noticeably smaller.
+
+Instead of setting compression options one by one, ``info`` may be
+updated with one of ``pnglpng.PROFILES``, *e.g.*
+``info |= pnglpng.PROFILES['balanced']``, each setting zlib level,
+``strategy``, ``mem_level`` and ``filter_type``:
+
+- ``'fastest'``: level 1, ``Z_RLE``, no filter; meant for pixel art,
+  poor on smooth gradients;
+- ``'balanced'``: level 6, ``Z_FILTERED``, Up filter;
+- ``'smallest'``: level 9, default strategy, memLevel 9, adaptive filter.
+
+Compression time (ms) and PNG size (bytes) with ``png.Writer``,
+single thread:
+
++--------------------------------+-------------+-------------+--------------+
+| Image, size, color type        | level 3     | level 9     | fastest      |
++================================+=============+=============+==============+
+| Sprite 9x, 1800*1350, indexed  | 10 / 60099  | 150 / 29006 | 10 / 46091   |
++--------------------------------+-------------+-------------+--------------+
+| Sprite 3xSFX, 1200*900, indexed| 4 / 25242   | 58 / 13395  | 4 / 20817    |
++--------------------------------+-------------+-------------+--------------+
+| Gradient 6x, 1200*900, RGB     | 12 / 156786 | 23 / 125582 | 58 / 2584444 |
++--------------------------------+-------------+-------------+--------------+
+
++--------------------------------+-------------+--------------+
+| Image, size, color type        | balanced    | smallest     |
++================================+=============+==============+
+| Sprite 9x, 1800*1350, indexed  | 33 / 32998  | 417 / 29655  |
++--------------------------------+-------------+--------------+
+| Sprite 3xSFX, 1200*900, indexed| 15 / 15809  | 211 / 13426  |
++--------------------------------+-------------+--------------+
+| Gradient 6x, 1200*900, RGB     | 35 / 6599   | 299 / 5529   |
++--------------------------------+-------------+--------------+
+
+Indexed color PNG may be processed without expanding palette to RGB with ::
+
+    X, Y, Z, maxcolors, list_3d, info = pnglpng.png2list(in_filename, indexed=True)
+
+which returns palette indices as one channel pixels, and keeps palette in
+``info``; ``list2png`` writes such a list back with the same palette.
+
+For big images, use ::
+
+    X, Y, Z, maxcolors, rows, info = pnglpng.png_rows(in_filename, layout)
+
+where ``rows`` is a generator, yielding rows one by one as they are
+decoded, so memory is bounded by one row, independent of image size
+(except for interlaced PNG, which PyPNG deinterlaces as a whole).
+``layout`` is one of:
+
+- ``'nested'``: row is a list (row) of lists (pixels) of ints (channels),
+  *i.e.* ``list_3d[y]``;
+- ``'packed'``: row is a list of ints, one per pixel, channels packed
+  big-endian, a byte per channel up to 8 bpc, *e.g.* 0xRRGGBB for 8 bpc
+  RGB, or 0x0300 for 2 bpc greyscale with tRNS (LA);
+- ``'flat'``: row is an ``array`` of channel values,
+  typecode ``'B'`` for up to 8 bpc and ``'H'`` for 16 bpc.
+
+Both ``png2list`` and ``png_rows`` accept ``start`` and ``stop`` row
+numbers, reading only the band of rows between them (``Y`` returned is
+band height, while ``info['size']`` remains full image size).
+Reading stops at ``stop``, so previews and partial processing of the top
+of a huge image take time proportional to rows read. ScaleNx result rows
+depend on one source row above and below (two for ScaleNxSFX), therefore
+to get scaled rows ``top * n`` to ``bottom * n`` read ``context`` rows
+more on each side::
+
+    start, stop = max(0, top - context), bottom + context
+    X, Y, Z, maxcolors, band, info = pnglpng.png2list(in_filename, start=start, stop=stop)
+
+and drop ``(top - start) * n`` leading rows from scaled ``band``, keeping
+``(bottom - top) * n`` rows (less at image bottom).
+
+Rows coming one by one, *e.g.* from ``png_rows`` through
+``scalenx.scaleNx_rows``, which does the above band bookkeeping,
+are written with ::
+
+    pnglpng.rows2png(out_filename, X, Y, Z, rows, info)
+
+keeping only a few rows in memory.
+
+To learn image dimensions and bit depth without decoding image data
+(*e.g.* for memory and time estimates, or ordering batch jobs), use ::
+
+    X, Y, Z, maxcolors, info = pnglpng.png_probe(in_filename)
+
+which returns the same values as ``png2list``, except ``list_3d``,
+reading only the chunks preceding iDAT.
+
+Programs, processing image data with ``array``, ``memoryview`` or
+other buffer-aware tools, may use ::
+
+    X, Y, Z, maxcolors, image_array, info = pnglpng.png2array(in_filename)
+    pnglpng.array2png(out_filename, X, Y, Z, image_array, info)
+
+where ``image_array`` is a flat ``array`` of channel values, same
+typecodes as ``'flat'`` rows above.
+
+All reading functions take, instead of file name, bytes-like object
+holding PNG (bytes are used without copying) or binary file object,
+and all writing functions take binary file object, so images may be
+decoded from and encoded to memory or network stream with no
+temporary files::
+
+    X, Y, Z, maxcolors, list_3d, info = pnglpng.png2list(received_bytes)
+    pnglpng.list2png(output_stream, list_3d, info)
 
 References
 ----------
@@ -71,25 +191,230 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2024-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '26.3.8.312'
+__version__ = '26.10.19.23'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
 
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import partial
+from io import BytesIO
+from itertools import chain, islice
+from os import PathLike
+from sys import byteorder
+from typing import BinaryIO
+from zlib import Z_DEFAULT_STRATEGY, Z_FILTERED, Z_RLE
+
 from .png import Reader, Writer
 
+# ↓ Named sets of png.Writer compression options, to be merged into info
+PROFILES = {
+    'fastest': {'compression': 1, 'strategy': Z_RLE, 'mem_level': 8, 'filter_type': 0},
+    'balanced': {'compression': 6, 'strategy': Z_FILTERED, 'mem_level': 8, 'filter_type': 2},
+    'smallest': {'compression': 9, 'strategy': Z_DEFAULT_STRATEGY, 'mem_level': 9, 'filter_type': 'adaptive'},
+}
+
+""" ╭─────────────╮
+    │ Shared ints │
+    ╰─────────────╯ """
+_shorts: list[int] = []
+
+
+def _short_ints() -> list[int]:
+    """Return list of all 16 bit int objects, built on first call.
+
+    Python caches small ints only, so every 16 bpc sample read would
+    become a separate int object, larger than pointer to it. Samples taken
+    from this list share one object per value, making 16 bpc nested list
+    as compact as 8 bpc one; scaled images, sharing pixels with source,
+    stay compact as well.
+
+    """
+
+    if not _shorts:
+        _shorts.extend(range(65536))
+    return _shorts
+
+
+""" ╭────────────────────╮
+    │ PNG source, target │
+    ╰────────────────────╯ """
+def _reader(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> Reader:
+    """Return PyPNG Reader for file name, bytes-like object or binary file object."""
+
+    if isinstance(in_filename, (str, PathLike)):
+        return Reader(filename=in_filename)
+    if isinstance(in_filename, (bytes, bytearray, memoryview)):
+        return Reader(file=BytesIO(in_filename))  # bytes are shared, not copied
+    return Reader(file=in_filename)
+
+
+def _write(out_filename: str | PathLike | BinaryIO, writer: Writer, rows: Iterable) -> None:
+    """Write rows with PyPNG ``writer`` to file name or binary file object."""
+
+    if isinstance(out_filename, (str, PathLike)):
+        with open(out_filename, 'wb') as result_png:
+            writer.write(result_png, rows)
+    else:
+        writer.write(out_filename, rows)
+
+
+""" ╭──────────╮
+    │ png_rows │
+    ╰──────────╯ """
+def png_rows(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO, layout: str = 'nested', indexed: bool = False, start: int = 0, stop: int | None = None) -> tuple[int, int, int, int, Iterator[list[list[int]] | list[int] | array], dict[str, int | bool | tuple | list[tuple]]]:
+    """Take PNG filename and return PNG data with rows generator.
+
+    :param in_filename: input file name, or bytes-like object holding PNG,
+        or binary file object (*e.g.* ``BytesIO`` or socket file);
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :param str layout: rows layout, either ``'nested'``, or ``'packed'``,
+        or ``'flat'`` (see module docstring);
+    :param bool indexed: if True, indexed color PNG is read as palette
+        indices (see ``png2list``); other PNG are read as usual;
+    :param int start: first row to return;
+    :param stop: row to stop before, None or anything beyond image height
+        meaning image end; rows after ``stop`` are not decoded
+        (except for interlaced PNG);
+    :type stop: int | None
+    :raises ValueError: Attempt to use unknown ``layout``, or empty row range.
+    :return X, Y, Z, maxcolors, rows, info: tuple, consisting of:
+
+    - **``X``**, **``Y``**, **``Z``**: PNG image dimensions (int),
+      ``Y`` being the number of rows from ``start`` to ``stop``;
+    - **``maxcolors``**: number of colors per channel for current image (int),
+      ``2 ** bitdepth - 1``;
+    - **``rows``**: generator, yielding Y rows in chosen ``layout``,
+      decoded from PNG iDAT one by one;
+    - **``info``**: dictionary of PNG chunks like resolution *etc.*,
+      as they are accessible by PyPNG; ``info['size']`` is full image size.
+
+    """
+
+    if layout not in ('nested', 'packed', 'flat'):
+        raise ValueError(f'Unknown rows layout {layout}')
+
+    source = _reader(in_filename)
+
+    if indexed:
+        source.preamble()
+        indexed = source.colormap  # Only indexed color PNG are read as indices
+
+    # ↓ Opening image, iDAT comes to "pixels" generator
+    if indexed:
+        X, Y, pixels, info = source.read()
+        info['colormap'] = True
+        # ↓ Duplicate palette entries would make equal colors look different
+        #   to ScaleNx, therefore all duplicates are replaced with the first one
+        first = {}
+        remap = bytes(first.setdefault(entry, i) for i, entry in enumerate(info['palette']))
+        if remap != bytes(range(len(remap))):
+            table = remap + bytes(range(len(remap), 256))
+            pixels = (bytearray(row).translate(table) for row in pixels)
+    else:
+        X, Y, pixels, info = source.asDirect()
+
+    Z = info['planes']  # Channels number
+    bitdepth = info['bitdepth']
+    maxcolors = 2**bitdepth - 1  # Maximal value of a color for given bits / channel
+    typecode = 'H' if bitdepth > 8 else 'B'
+
+    # ↓ Row range. Rows before start are decoded and dropped since each row
+    #   is unfiltered against the previous one; reading iDAT stops at stop.
+    stop = Y if stop is None else min(stop, Y)
+    if not 0 <= start < stop:
+        raise ValueError(f'Row range {start}:{stop} is empty or out of image height {Y}')
+    if (start, stop) != (0, Y):
+        pixels = islice(pixels, start, stop)
+        Y = stop - start
+
+    def nested(pixels):
+        """Yield rows of pixels lists."""
+
+        if bitdepth > 8:
+            shorts = _short_ints().__getitem__
+            for row in pixels:
+                yield list(map(list, zip(*[map(shorts, row)] * Z)))
+            return
+        for row in pixels:
+            yield list(map(list, zip(*[iter(row)] * Z)))
+
+    def packed(pixels):
+        """Yield rows of pixels packed into ints."""
+
+        if Z == 1:  # One channel, values are pixels already
+            yield from (list(row) for row in pixels)
+            return
+        # ↓ Multichannel, including below 8 bpc greyscale with tRNS, expanded to LA;
+        #   each channel takes whole byte (two bytes for 16 bpc)
+        from_bytes = partial(int.from_bytes, byteorder='big')
+        width = Z * (2 if bitdepth > 8 else 1)  # Bytes per pixel
+        for row in pixels:
+            row = array(typecode, row)
+            if bitdepth > 8 and byteorder == 'little':
+                row.byteswap()  # Big-endian samples give big-endian pixels
+            yield list(map(from_bytes, zip(*[iter(row.tobytes())] * width)))
+
+    def flat(pixels):
+        """Yield rows of channel values arrays."""
+
+        for row in pixels:
+            yield array(typecode, row)
+
+    rows = {'nested': nested, 'packed': packed, 'flat': flat}[layout](pixels)
+
+    return (X, Y, Z, maxcolors, rows, info)
+
+
+""" ╭───────────╮
+    │ png_probe │
+    ╰───────────╯ """
+def png_probe(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO, indexed: bool = False) -> tuple[int, int, int, int, dict[str, int | bool | tuple | list[tuple]]]:
+    """Take PNG filename and return PNG image properties without decoding image data.
+
+    :param in_filename: input file name, or bytes-like object holding PNG,
+        or binary file object (*e.g.* ``BytesIO`` or socket file);
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :param bool indexed: if True, indexed color PNG is described
+        as palette indices (see ``png2list``);
+    :return X, Y, Z, maxcolors, info: tuple, the same as ``png2list``
+        would return for the same file, except ``list_3d``.
+
+    """
+
+    # ↓ Rows generator does not touch iDAT until first row is requested,
+    #   so only chunks preceding iDAT are read
+    X, Y, Z, maxcolors, rows, info = png_rows(in_filename, 'flat', indexed)
+    rows.close()
+
+    return (X, Y, Z, maxcolors, info)
+
+
 """ ╭──────────╮
     │ png2list │
     ╰──────────╯ """
-def png2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]], dict[str, int | bool | tuple | list[tuple]]]:
+def png2list(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO, indexed: bool = False, start: int = 0, stop: int | None = None) -> tuple[int, int, int, int, list[list[list[int]]], dict[str, int | bool | tuple | list[tuple]]]:
     """Take PNG filename and return PNG data in a human-friendly form.
 
-    :param str in_filename: input file name;
+    :param in_filename: input file name, or bytes-like object holding PNG,
+        or binary file object (*e.g.* ``BytesIO`` or socket file);
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :param bool indexed: if True, and PNG is indexed color, return palette
+        indices as one channel pixels, and keep ``info['palette']``,
+        with ``info['colormap']`` set to True; ``list2png`` writes such an
+        image back as indexed color PNG with the same palette.
+        Other PNG are read as usual, expanded to greyscale or truecolor;
+    :param int start: first row to read;
+    :param stop: row to stop reading before, None meaning image end
+        (see ``png_rows``);
+    :type stop: int | None
     :return X, Y, Z, maxcolors, list_3d, info: tuple, consisting of:
 
-    - **``X``**, **``Y``**, **``Z``**: PNG image dimensions (int);
+    - **``X``**, **``Y``**, **``Z``**: PNG image dimensions (int),
+      ``Y`` being the number of rows read;
     - **``maxcolors``**: number of colors per channel for current image (int),
-      either 1, or 255, or 65535, for 1 bpc, 8 bpc and 16 bpc PNG,
+      either 1, or 3, or 15, or 255, or 65535, for 1, 2, 4, 8 and 16 bpc PNG,
       respectively;
     - **``list_3d``**: Y * X * Z list (image) of lists (rows) of lists (pixels)
       of ints (channels), from PNG iDAT;
@@ -98,32 +423,141 @@ def png2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]
 
     """
 
-    source = Reader(in_filename)
+    X, Y, Z, maxcolors, rows, info = png_rows(in_filename, 'nested', indexed, start, stop)
 
-    # ↓ Opening image, iDAT comes to "pixels" generator
-    X, Y, pixels, info = source.asDirect()
+    # ↓ Collecting rows as they are decoded, without freezing whole iDAT first
+    list_3d = list(rows)
 
-    Z = info['planes']  # Channels number
-    if info['bitdepth'] == 1:
-        maxcolors = 1  # Maximal value of a color for 1-bit / channel
-    elif info['bitdepth'] == 8:
-        maxcolors = 255  # Maximal value of a color for 8-bit / channel
-    elif info['bitdepth'] == 16:
-        maxcolors = 65535  # Maximal value of a color for 16-bit / channel
+    return (X, Y, Z, maxcolors, list_3d, info)
 
-    # ↓ Freezing tuple of bytes or whatever "pixels" generator returns
-    imagedata = tuple(pixels)
 
-    # ↓ Forcedly create 3D list of int out of "imagedata" tuple of hell knows what
-    list_3d = [[[int((imagedata[y])[(x * Z) + z]) for z in range(Z)] for x in range(X)] for y in range(Y)]
+""" ╭───────────────────────────╮
+    │ Fixing info to match data │
+    ╰───────────────────────────╯ """
+def _fix_info(info: dict[str, int | bool | tuple | list[tuple]], X: int, Y: int, Z: int) -> None:
+    """Overwrite ``info`` properties with ones determined from image data, in place."""
 
-    return (X, Y, Z, maxcolors, list_3d, info)
+    info['size'] = (X, Y)
+    info['planes'] = Z
+    if info.get('colormap', False) and 'palette' in info and Z == 1:
+        # ↓ Palette indices, as read by png2list(..., indexed=True), keep palette
+        info['alpha'] = False
+        info['greyscale'] = False
+        info.pop('background', None)  # bKGD is an index, unlike for smooth color
+        return None
+    info.pop('colormap', None)
+    if 'palette' in info:
+        del info['palette']  # images get promoted to smooth color when editing.
+    if 'background' in info:
+        # ↓ as image tend to get promoted to smooth color when editing,
+        #   background must either be rebuilt to match channels structure every time,
+        #   or be deleted.
+        #   info['background'] = (0,) * (Z - 1 + Z % 2)  # black for any color mode
+        del info['background']  # Destroy is better than rebuild ;-)
+    if (Z % 2) == 1:
+        info['alpha'] = False
+    else:
+        info['alpha'] = True
+    if Z < 3:
+        info['greyscale'] = True
+    else:
+        info['greyscale'] = False
+
+
+""" ╭───────────────╮
+    │ Build palette │
+    ╰───────────────╯ """
+def _build_palette(list_3d: list[list[list[int]]], Z: int, bitdepth: int, transparent: tuple | None = None) -> tuple[list[tuple[int, ...]], dict[tuple[int, ...], int]] | None:
+    """Collect colors of ``list_3d`` into PNG palette, if possible.
+
+    :return palette, index: tuple, consisting of:
+
+    - ``palette``: list of RGBA tuples for colors with alpha below maximum,
+      followed by RGB tuples for opaque ones, as PLTE and tRNS require;
+    - ``index``: dictionary, mapping pixel tuples to palette indices.
+
+    ``None`` if image is greyscale, or contains more than 256 colors,
+    or 16 bpc colors not fitting 8 bpc palette, or pixels with channels above 4-th.
+
+    """
+
+    # ↓ Greyscale stays greyscale, since palette would turn it to RGB on reading
+    if Z < 3 or len(list_3d[0][0]) != Z:
+        return None
+
+    # ↓ Collecting unique colors row by row, with early exit
+    colors = set()
+    for row in list_3d:
+        colors.update(map(tuple, row))
+        if len(colors) > 256:
+            return None
+
+    # ↓ Palette entries are 8 bpc; 16 bpc colors must be exactly 8 bpc ones * 257
+    divisor = 1
+    if bitdepth > 8:
+        if any(channel % 257 for color in colors for channel in color):
+            return None
+        divisor = 257
+
+    alpha = Z == 4
+    transparent = tuple(transparent) if transparent is not None else None
+    see_through = []
+    opaque = []
+    for color in sorted(colors):
+        rgb = tuple(channel // divisor for channel in color[:3])
+        if alpha:
+            a = color[3] // divisor
+        else:
+            a = 0 if color == transparent else 255
+        if a < 255:
+            see_through.append((color, rgb + (a,)))
+        else:
+            opaque.append((color, rgb))
+
+    entries = see_through + opaque
+    palette = [entry for color, entry in entries]
+    index = {color: i for i, (color, entry) in enumerate(entries)}
+
+    return palette, index
+
+
+""" ╭──────────────────────────╮
+    │ Lower greyscale bitdepth │
+    ╰──────────────────────────╯ """
+def _grey_bitdepth(list_3d: list[list[list[int]]], Z: int, bitdepth: int) -> tuple[int, int] | None:
+    """Find the lowest bit depth, representing greyscale ``list_3d`` losslessly.
+
+    :return bitdepth, step: tuple, consisting of 1, 2 or 4 bit depth,
+        and source values step between its levels (*e.g.* 255 for
+        8 bpc image containing only 0 and 255, written as 1 bpc);
+        ``None`` if image is not 8 or 16 bpc greyscale without alpha,
+        or no lower bit depth fits.
+
+    """
+
+    if Z != 1 or bitdepth < 8 or len(list_3d[0][0]) != 1:
+        return None
+
+    # ↓ Collecting unique values row by row, with early exit
+    values = set()
+    for row in list_3d:
+        values.update(chain.from_iterable(row))
+        if len(values) > 16:
+            return None
+
+    maxval = 2**bitdepth - 1
+    for low in (1, 2, 4):
+        step = maxval // (2**low - 1)
+        if all(value % step == 0 for value in values):
+            return low, step
+
+    return None
 
 
 """ ╭──────────╮
     │ list2png │
     ╰──────────╯ """
-def list2png(out_filename: str, list_3d: list[list[list[int]]], info: dict[str, int | bool | tuple | list[tuple]]) -> None:
+def list2png(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], info: dict[str, int | bool | tuple | list[tuple]], indexed: bool = False) -> None:
     """Take filename and image data, and create PNG file.
 
     :param list_3d: Y * X * Z list (image) of lists (rows) of lists (pixels)
@@ -132,7 +566,14 @@ def list2png(out_filename: str, list_3d: list[list[list[int]]], info: dict[str,
     :param info: dictionary, chunks like resolution etc. as you want them
         to be present in PNG;
     :type info: dict[str, int | bool | tuple | list[tuple]]
-    :param str out_filename: output PNG file name (str).
+    :param out_filename: output PNG file name, or binary file object
+        (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param bool indexed: if True, and RGB or RGBA image contains 256 colors
+        or less, write indexed color PNG with the smallest possible bit depth;
+        if greyscale image levels fit 1, 2 or 4 bpc (*e.g.* bilevel image
+        of 0 and 255), write greyscale PNG with such bit depth;
+        otherwise write greyscale or truecolor PNG as usual.
 
     .. note:: ``X``, ``Y`` and ``Z`` detected from the list structure
        override those set in ``info``.
@@ -148,36 +589,168 @@ def list2png(out_filename: str, list_3d: list[list[list[int]]], info: dict[str,
 
     # ↓ Overwriting "info" properties with ones determined from the list.
     #   Necessary when image is edited.
-    info['size'] = (X, Y)
-    info['planes'] = Z
-    if 'palette' in info:
-        del info['palette']  # images get promoted to smooth color when editing.
-    if 'background' in info:
-        # ↓ as image tend to get promoted to smooth color when editing,
-        #   background must either be rebuilt to match channels structure every time,
-        #   or be deleted.
-        #   info['background'] = (0,) * (Z - 1 + Z % 2)  # black for any color mode
-        del info['background']  # Destroy is better than rebuild ;-)
-    if (Z % 2) == 1:
-        info['alpha'] = False
-    else:
-        info['alpha'] = True
-    if Z < 3:
-        info['greyscale'] = True
-    else:
-        info['greyscale'] = False
+    _fix_info(info, X, Y, Z)
 
     # ↓ Flattening 3D list to 2D list of rows for PNG `.write` method
     def flatten_2d(list_3d: list[list[list[int]]]):
         """Flatten `list_3d` to 2D list of rows, yield generator."""
 
-        yield from ([list_3d[y][x][z] for x in range(X) for z in range(Z)] for y in range(Y))
+        if len(list_3d[0][0]) == Z:
+            # ↓ Joining pixels at C level
+            yield from (list(chain.from_iterable(row)) for row in list_3d)
+        else:
+            # ↓ Dropping channels above 4-th
+            yield from ([list_3d[y][x][z] for x in range(X) for z in range(Z)] for y in range(Y))
+
+    # ↓ Trying indexed color or lower bit greyscale,
+    #   falling back to source color mode if too many colors
+    palette = _build_palette(list_3d, Z, info['bitdepth'], info.get('transparent', None)) if indexed else None
+    # ↓ Palette indices, as read by png2list(..., indexed=True), are never rescaled
+    indices = info.get('colormap', False) and 'palette' in info
+    grey = _grey_bitdepth(list_3d, Z, info['bitdepth']) if indexed and not indices and 'transparent' not in info else None
+
+    if grey is not None:
+        bitdepth, step = grey
+        writer = Writer(X, Y, **(info | {'bitdepth': bitdepth}))
+        if info['bitdepth'] == 8:
+            # ↓ One translate per row instead of per sample division
+            table = bytes(v // step for v in range(256))
+            rows = (bytes(chain.from_iterable(row)).translate(table) for row in list_3d)
+        else:
+            rows = ([v // step for v in chain.from_iterable(row)] for row in list_3d)
+    elif palette is None:
+        # ↓ Writing PNG with `.write` method (row by row),
+        #   using `flatten_2d` generator to save memory
+        writer = Writer(X, Y, **info)
+        rows = flatten_2d(list_3d)
+    else:
+        palette, index = palette
+        # ↓ Indexed image properties go to a copy, keeping caller "info" smooth color
+        indexed_info = info | {
+            'palette': palette,
+            'bitdepth': next(bitdepth for bitdepth in (1, 2, 4, 8) if len(palette) <= 2**bitdepth),
+            'planes': 1,
+            'colormap': True,
+            'greyscale': False,
+            'alpha': False,
+        }
+        indexed_info.pop('transparent', None)  # Moved to palette alpha
+        writer = Writer(X, Y, **indexed_info)
+        rows = (list(map(index.__getitem__, map(tuple, row))) for row in list_3d)
+
+    _write(out_filename, writer, rows)
+
+    return None
+
+
+""" ╭──────────╮
+    │ rows2png │
+    ╰──────────╯ """
+def rows2png(out_filename: str | PathLike | BinaryIO, X: int, Y: int, Z: int, rows: Iterable[list[list[int]]], info: dict[str, int | bool | tuple | list[tuple]]) -> None:
+    """Take filename and image rows coming one by one, and create PNG file.
+
+    Unlike ``list2png``, rows are consumed as they come, so ``rows``
+    may be generator (*e.g.* ``png_rows`` or scaler yielding rows),
+    keeping only a few rows in memory; for the same reason
+    indexed color is never tried.
+
+    :param out_filename: output PNG file name, or binary file object
+        (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param int X: image width, pixels;
+    :param int Y: image height, the number of rows ``rows`` yield;
+    :param int Z: channels per pixel; channels above 4-th are dropped;
+    :param rows: iterable of lists (rows) of lists (pixels) of ints (channels);
+    :type rows: Iterable[list[list[int]]]
+    :param info: dictionary, chunks like resolution etc. as you want them
+        to be present in PNG;
+    :type info: dict[str, int | bool | tuple | list[tuple]]
+
+    """
+
+    _fix_info(info, X, Y, min(Z, 4))
+
+    if Z <= 4:
+        # ↓ Joining pixels at C level
+        flat_rows = (list(chain.from_iterable(row)) for row in rows)
+    else:
+        # ↓ Dropping channels above 4-th
+        flat_rows = ([pixel[z] for pixel in row for z in range(4)] for row in rows)
 
-    # ↓ Writing PNG with `.write` method (row by row),
-    #   using `flatten_2d` generator to save memory
     writer = Writer(X, Y, **info)
-    with open(out_filename, 'wb') as result_png:
-        writer.write(result_png, flatten_2d(list_3d))
+    _write(out_filename, writer, flat_rows)
+
+    return None
+
+
+""" ╭───────────╮
+    │ png2array │
+    ╰───────────╯ """
+def png2array(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[int, int, int, int, array, dict[str, int | bool | tuple | list[tuple]]]:
+    """Take PNG filename and return PNG data as flat array.
+
+    :param in_filename: input file name, or bytes-like object holding PNG,
+        or binary file object (*e.g.* ``BytesIO`` or socket file);
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :return X, Y, Z, maxcolors, image_array, info: tuple, consisting of:
+
+    - **``X``**, **``Y``**, **``Z``**: PNG image dimensions (int);
+    - **``maxcolors``**: number of colors per channel for current image (int),
+      ``2 ** bitdepth - 1``;
+    - **``image_array``**: flat ``array`` of Y * X * Z channel values,
+      typecode ``'B'`` for up to 8 bpc and ``'H'`` for 16 bpc;
+      value of channel ``z`` of pixel ``x`` in row ``y`` is
+      ``image_array[(y * X + x) * Z + z]``;
+    - **``info``**: dictionary of PNG chunks like resolution *etc.*,
+      as they are accessible by PyPNG.
+
+    """
+
+    X, Y, Z, maxcolors, rows, info = png_rows(in_filename, 'flat')
+
+    image_array = array('H' if info['bitdepth'] > 8 else 'B')
+    for row in rows:
+        image_array.extend(row)  # Same typecode arrays, copied at C level
+
+    return (X, Y, Z, maxcolors, image_array, info)
+
+
+""" ╭───────────╮
+    │ array2png │
+    ╰───────────╯ """
+def array2png(out_filename: str | PathLike | BinaryIO, X: int, Y: int, Z: int, image_array: array | memoryview, info: dict[str, int | bool | tuple | list[tuple]]) -> None:
+    """Take filename, image dimensions and flat image data, and create PNG file.
+
+    :param out_filename: output PNG file name, or binary file object
+        (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param int X: image width;
+    :param int Y: image height;
+    :param int Z: image channels number, 1 to 4;
+    :param image_array: flat ``array`` (or ``memoryview``) of Y * X * Z
+        channel values, as returned by ``png2array``;
+    :type image_array: array | memoryview
+    :param info: dictionary, chunks like resolution etc. as you want them
+        to be present in PNG;
+    :type info: dict[str, int | bool | tuple | list[tuple]]
+
+    .. note:: ``X``, ``Y`` and ``Z`` given override those set in ``info``.
+    .. warning:: Correct ``info['bitdepth']`` is **critical**
+       because it cannot be detected from the array.
+
+    """
+
+    if len(image_array) != X * Y * Z:
+        raise ValueError(f'Array length {len(image_array)} does not match {X} x {Y} x {Z} image')
+
+    _fix_info(info, X, Y, Z)
+
+    # ↓ Rows are passed to `.write` as memoryview slices, without copying
+    with memoryview(image_array) as view:
+        row_length = X * Z
+        rows = (view[y * row_length : (y + 1) * row_length] for y in range(Y))
+        writer = Writer(X, Y, **info)
+        _write(out_filename, writer, rows)
 
     return None
 
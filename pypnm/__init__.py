@@ -6,10 +6,10 @@ PyPNM
 PPM and PGM image files reading, displaying and writing for Python >=3.11.
 --------------------------------------------------------------------------
 
-:Abstract: Current module encompass functions for reading `PPM`_, `PGM`_ or
-    `PBM`_ file as image list[list[list[int]]], displaying corresponding
+:Abstract: Current module encompass functions for reading `PPM`_, `PGM`_,
+    `PBM`_ or `PAM`_ file as image list[list[list[int]]], displaying corresponding
     nested list by means of Tkinter, and writing an image nested list to
-    `PPM`_ or `PGM`_ file.
+    `PPM`_, `PGM`_, `PBM`_ or `PAM`_ file.
 
     All functions are implemented in pure Python with minimal import of
     standard CPython modules.
@@ -23,7 +23,7 @@ recommended import::
 
 or::
 
-    from pypnm import list2bin, list2pnm, pnm2list
+    from pypnm import PnmImage, band2pnm, frames2pnm, list2bin, list2pam, list2pbm, list2pnm, pnm2array, pnm2list, pnm_allocate, pnm_frames, pnm_probe, pnm_rows, rows2pam, rows2pnm
 
 legacy import, still operational but considered mauvais ton::
 
@@ -44,13 +44,45 @@ to access functions:
 - **``list2pnm``**: getting image data as nested list of int and writing
   either binary or ASCII PNM file depending on ``bin`` bool argument.
 
+- **``list2pbm``**: getting bilevel image data as nested list of int
+  and writing binary PBM (P4) file.
+
+- **``list2pam``**, **``rows2pam``**: writing PAM (P7) file, keeping alpha,
+  from nested list or from rows coming one by one.
+
+- **``pnm_frames``**, **``frames2pnm``**: reading and writing frame sequences,
+  *i.e.* binary PNM images following one another in a file or stream.
+
+- **``pnm_allocate``**, **``band2pnm``**: creating full size binary PNM file
+  and writing bands of rows into it in place, from several processes at once.
+
+- **``pnm_probe``**: reading PNM file header only and returning
+  image dimensions and maxcolors, without reading image data.
+
+- **``pnm2array``**: reading binary PPM or PGM file and returning
+  image data as flat ``array.array``, compact and fast to read.
+
+- **``pnm_rows``**: reading PNM file and returning rows generator,
+  parsing rows one by one, ASCII files included.
+
+- **``PnmImage``**: binary PPM or PGM file mapped to memory, giving
+  rows on demand, for images too big to be read as nested list.
+
+- **``rows2pnm``**: writing binary PNM file from rows coming one by one,
+  *e.g.* from ``PnmImage`` or streaming scaler.
+
+Reading functions also take bytes-like object or binary file object
+instead of file name, and writing functions take binary file object,
+so no temporary files are needed to process images in memory.
+
 
 Formats compatibility
 ---------------------
 
 Module provides full read and write support for 8 and 16 bpc binary and ASCII
-`PPM`_ and `PGM`_ image files, and read-only support for
-1 bpc binary and ASCII `PBM`_ files.
+`PPM`_ and `PGM`_ image files, read support for 1 bpc binary and ASCII
+`PBM`_ files, write support for 1 bpc binary `PBM`_ files, and full read
+and write support for 8 and 16 bpc L, LA, RGB and RGBA `PAM`_ files.
 
 Python compatibility
 --------------------
@@ -91,20 +123,34 @@ In case of introducing useful modifications it's your duty to all human race
 
 .. _PBM: https://netpbm.sourceforge.net/doc/pbm.html
 
+.. _PAM: https://netpbm.sourceforge.net/doc/pam.html
+
 """
 
 __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2024-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '2.26.27.312'
+__version__ = '2.26.27.324'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
 
-from .pnmlpnm import list2bin, list2pnm, pnm2list
+from .pnmlpnm import PnmImage, band2pnm, frames2pnm, list2bin, list2pam, list2pbm, list2pnm, pnm2array, pnm2list, pnm_allocate, pnm_frames, pnm_probe, pnm_rows, rows2pam, rows2pnm
 
 # ↓ Assignments below do nothing but stop linter from bitching and whining.
 pnm2list = pnm2list
 list2bin = list2bin
 list2pnm = list2pnm
+pnm_probe = pnm_probe
+pnm2array = pnm2array
+PnmImage = PnmImage
+rows2pnm = rows2pnm
+list2pbm = list2pbm
+pnm_rows = pnm_rows
+list2pam = list2pam
+rows2pam = rows2pam
+pnm_frames = pnm_frames
+frames2pnm = frames2pnm
+pnm_allocate = pnm_allocate
+band2pnm = band2pnm
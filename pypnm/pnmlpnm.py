@@ -16,9 +16,20 @@ PyPNM module comprise a set of functions for dealing with
 Python nested lists, namely:
 
 - **``pnm2list``**: reading binary or ASCII
-  RGB `PPM`_, or L `PGM`_, or ink on/off `PBM`_ file
+  RGB `PPM`_, or L `PGM`_, or ink on/off `PBM`_ file,
+  or L, LA, RGB or RGBA `PAM`_ file
   and returning image data as nested list of int.
 
+- **``pnm_probe``**: reading PBM, PGM or PPM file header only
+  and returning image dimensions and maxcolors, without image data.
+
+- **``pnm_rows``**: reading PNM file (except ASCII PBM) and returning
+  rows generator, parsing rows one by one, for images too big
+  to be read as a whole.
+
+- **``pnm2array``**: reading binary PPM, PGM or PAM file
+  and returning image data as flat ``array.array``.
+
 - **``list2bin``**: getting image data as nested list of int and
   creating binary PPM (P6) or PGM (P5) data structure in memory.
 
@@ -34,9 +45,29 @@ Python nested lists, namely:
 - **``list2pnmascii``**: getting image data as nested list of int
   and writing ASCII PPM (P3) or PGM (P2) image file.
 
+- **``list2pbm``**: getting bilevel image data as nested list of int
+  and writing binary PBM (P4) image file.
+
+- **``list2pam``**, **``rows2pam``**: getting image data as nested list of int,
+  or rows one by one, and writing PAM (P7) image file, keeping alpha.
+
+- **``pnm_frames``**, **``frames2pnm``**: reading and writing sequences
+  of binary PNM images, following one another in a file or stream.
+
+- **``pnm_allocate``**, **``band2pnm``**: creating binary PNM file
+  of full size, and writing bands of rows into it in place,
+  *e.g.* from several processes at once.
+
 - **``list2pnm``**: getting image data as nested list of int
   and writing either binary or ASCII PNM file depending on ``bin`` value.
 
+- **``PnmImage``**: binary PPM or PGM file mapped to memory,
+  returning rows as nested lists on demand, for images too big
+  to be read as a whole.
+
+- **``rows2pnm``**: getting image rows one by one from iterable
+  and writing binary PPM (P6) or PGM (P5) image file.
+
 - ``create_image``: creating empty nested 3D list for image representation.
 
 Usage
@@ -52,6 +83,13 @@ for reading data from PPM/PGM, where:
 - ``maxcolors``: maximum value of color per channel for current image (int);
 - ``list_3d``: image pixel data as list(list(list(int)));
 
+or::
+
+    X, Y, Z, maxcolors = pnmlpnm.pnm_probe(in_filename)
+
+for getting the same image properties from file header only,
+*e.g.* for memory and time estimates before reading;
+
 and::
 
     pnm_bytes = pnmlpnm.list2bin(list_3d, maxcolors)
@@ -67,9 +105,19 @@ for writing data from ``list_3d`` nested list to PPM/PGM file ``out_filename``,
 where ``bin`` is a bool switch defining whether
 resulting file will be binary or ASCII.
 
+Reading functions take, instead of file name, bytes-like object
+holding PNM (used in place, without copying) or binary file object,
+and writing functions take binary file object, so images may be
+decoded from and encoded to memory or network stream with no
+temporary files (``pnm_allocate`` and ``band2pnm`` work on files only)::
+
+    X, Y, Z, maxcolors, list_3d = pnmlpnm.pnm2list(received_bytes)
+    pnmlpnm.list2pnm(output_stream, list_3d, maxcolors, bin)
+
 .. note:: ``maxcolors`` is either 255 for 8 bit or 65535 for 16 bit images.
     1 bit ink on/off images get promoted and inverted to 8 bit L upon import,
-    i.e. PBM converted to PGM when reading (writing PBM is not planned).
+    i.e. PBM converted to PGM when reading; use ``list2pbm``
+    to write bilevel image back to PBM.
 
 References
 ----------
@@ -89,6 +137,8 @@ References
 
 .. _PBM: https://netpbm.sourceforge.net/doc/pbm.html
 
+.. _PAM: https://netpbm.sourceforge.net/doc/pam.html
+
 .. _PyPNM for Python >= 3.11: https://github.com/Dnyarri/PyPNM/
 
 .. _PyPNM for Python >= 3.4: https://github.com/Dnyarri/PyPNM/tree/py34
@@ -105,14 +155,339 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2024-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '2.26.27.312'
+__version__ = '2.26.27.324'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
 
 import array
 import mmap
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from io import SEEK_END, BytesIO
+from itertools import chain, islice
+from os import PathLike
 from re import search, sub
+from sys import byteorder
+from typing import BinaryIO
+
+""" ╔═════════════╗
+    ║ Shared ints ║
+    ╚═════════════╝ """
+_shorts: list[int] = []
+
+
+def _short_ints() -> list[int]:
+    """Return list of all 16 bit int objects, built on first call.
+
+    Python caches small ints only, so every 16 bpc sample read would
+    become a separate int object. Samples taken from this list share
+    one object per value, making 16 bpc image list as compact as 8 bpc one.
+
+    """
+
+    if not _shorts:
+        _shorts.extend(range(65536))
+    return _shorts
+
+
+""" ╔═══════════════╗
+    ║ Input sources ║
+    ╚═══════════════╝ """
+
+
+def _source_buffer(in_file: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[bytes | bytearray | mmap.mmap, bool]:
+    """Return whole PNM contents as buffer, and whether it is file mapping to be closed by caller.
+
+    File name is mapped to memory; bytes and bytearray (or memoryview of whole
+    one) are used as is, with no copy; ``BytesIO`` gives its value, shared
+    with bytes it was created from; other file objects are read to the end.
+
+    """
+
+    if isinstance(in_file, (str, PathLike)):
+        with open(in_file, 'rb') as file:  # mmap stays valid after file closed
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), True
+    if isinstance(in_file, (bytes, bytearray, mmap.mmap)):
+        return in_file, False
+    if isinstance(in_file, memoryview):
+        if isinstance(in_file.obj, (bytes, bytearray)) and in_file.contiguous and in_file.nbytes == len(in_file.obj):
+            return in_file.obj, False
+        return in_file.tobytes(), False  # Part of buffer, copied
+    if isinstance(in_file, BytesIO):
+        position = in_file.tell()
+        in_file.seek(0, SEEK_END)  # Consumed, as if read
+        return in_file.getvalue()[position:] if position else in_file.getvalue(), False
+    return in_file.read(), False
+
+
+@contextmanager
+def _pnm_source(in_file: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> Iterator[bytes | bytearray | mmap.mmap]:
+    """Give PNM contents buffer within ``with`` block, see ``_source_buffer``."""
+
+    full_bytes, mapped = _source_buffer(in_file)
+    try:
+        yield full_bytes
+    finally:
+        if mapped:
+            full_bytes.close()
+
+
+""" ╔══════════════╗
+    ║ P6/P5 header ║
+    ╚══════════════╝ """
+
+
+def _p65_header(full_bytes: bytes | mmap.mmap) -> tuple[int, int, int, int, int]:
+    """Parse P6 or P5 header, or the same P3 or P2 header.
+
+    :param full_bytes: whole file contents, or mmap of file;
+    :raises ValueError: Header is broken;
+    :return X, Y, Z, maxcolors, offset: tuple, consisting of image properties
+        and ``offset`` of first image data byte.
+
+    """
+
+    header = search(
+        rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
+        rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
+        rb'\s*(\d+)\s(?:\s*#.*\s)*'
+        rb'\s*(\d+)\s)',
+        full_bytes,
+    )
+    if header is None:
+        raise ValueError(f'Broken {bytes(full_bytes[:2])} header')
+
+    # ↓ Splitting header into image properties values
+    magic, X, Y, maxcolors = header.groups()
+    X = int(X)
+    Y = int(Y)
+    Z = 3 if magic[:2] in (b'P6', b'P3') else 1  # PPM, or else PGM
+    maxcolors = int(maxcolors)
+
+    # ↓ Image data start right after header, no need to cut header off
+    return (X, Y, Z, maxcolors, header.end())
+
+
+""" ╔═══════════╗
+    ║ P7 header ║
+    ╚═══════════╝ """
+
+
+def _p7_header(full_bytes: bytes | mmap.mmap) -> tuple[int, int, int, int, int]:
+    """Parse P7 (PAM) header.
+
+    :param full_bytes: whole file contents, or mmap of file,
+        or at least its part including ``ENDHDR`` line;
+    :raises ValueError: Header is broken;
+    :return X, Y, Z, maxcolors, offset: tuple, consisting of image properties
+        and ``offset`` of first image data byte.
+
+    """
+
+    end = full_bytes.find(b'ENDHDR')
+    offset = full_bytes.find(b'\n', end) + 1  # Image data start after ENDHDR line
+    if end < 0 or not offset:
+        raise ValueError('Broken P7 header')
+
+    # ↓ Header lines are "KEYWORD value", comments and empty lines allowed
+    fields = {}
+    for line in full_bytes[:end].splitlines()[1:]:
+        tokens = line.split(b'#', 1)[0].split()
+        if tokens:
+            fields[tokens[0]] = tokens[1:]
+    try:
+        X, Y, Z, maxcolors = (int(fields[keyword][0]) for keyword in (b'WIDTH', b'HEIGHT', b'DEPTH', b'MAXVAL'))
+    except (KeyError, IndexError, ValueError):
+        raise ValueError('Broken P7 header') from None
+
+    return (X, Y, Z, maxcolors, offset)
+
+
+def _binary_header(full_bytes: bytes | mmap.mmap) -> tuple[int, int, int, int, int]:
+    """Parse P6, P5 or P7 header, see ``_p65_header``.
+
+    :raises ValueError: File is not P5, P6 or P7, or header is broken.
+
+    """
+
+    if full_bytes[:2] in (b'P6', b'P5'):
+        return _p65_header(full_bytes)
+    elif full_bytes[:2] == b'P7':
+        return _p7_header(full_bytes)
+    else:
+        raise ValueError(f'Header {bytes(full_bytes[:2])} is not P5, P6 or P7')
+
+
+""" ╔══════════════╗
+    ║ P4/P1 header ║
+    ╚══════════════╝ """
+
+
+def _p41_header(full_bytes: bytes | mmap.mmap) -> tuple[int, int, int]:
+    """Parse P4 or P1 header.
+
+    :param full_bytes: whole file contents, or mmap of file;
+    :raises ValueError: Header is broken;
+    :return X, Y, offset: tuple, consisting of image size
+        and ``offset`` of first image data byte.
+
+    """
+
+    # ↓ Note that for 1 bit pattern does not include maxcolors
+    header = search(
+        rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
+        rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
+        rb'\s*(\d+)\s)',
+        full_bytes,
+    )
+    if header is None:
+        raise ValueError(f'Broken {bytes(full_bytes[:2])} header')
+
+    return (int(header.group(2)), int(header.group(3)), header.end())
+
+
+""" ╔══════════════════════════╗
+    ║ Partial header tokenizer ║
+    ╚══════════════════════════╝ """
+# ↓ PNM whitespace, ending numbers, and comments as well
+_WHITESPACE = b' \t\n\v\f\r'
+
+
+def _header_tokens(head: bytes | bytearray, count: int) -> tuple[list[int], int] | None:
+    """Parse ``count`` numbers following magic in PNM header, which may be incomplete.
+
+    Used for streams, read piece by piece. Comments (from ``#`` to line end)
+    are skipped, and number is taken only when whitespace after it is at hand,
+    so neither numbers nor comments cut by piece end get misparsed.
+
+    :param head: beginning of PNM, ``'Pn'`` magic included;
+    :type head: bytes | bytearray
+    :param int count: numbers in header, 2 for PBM, 3 for PGM and PPM;
+    :raises ValueError: Header is broken;
+    :return values, offset: tuple, consisting of header numbers
+        and ``offset`` of first image data byte, *i.e.* the one after
+        single whitespace ending last number; ``None`` if ``head`` ends before.
+
+    """
+
+    values = []
+    position = 2  # Right after magic
+    end = len(head)
+    if end > position and head[position] not in _WHITESPACE and head[position] != 0x23:
+        raise ValueError(f'Broken {bytes(head[:2])} header')
+    while len(values) < count:
+        if position >= end:
+            return None
+        if head[position] in _WHITESPACE:
+            position += 1
+        elif head[position] == 0x23:  # '#', comment till line end
+            line_ends = [found for found in (head.find(b'\n', position), head.find(b'\r', position)) if found >= 0]
+            if not line_ends:
+                return None
+            position = min(line_ends) + 1
+        else:
+            start = position
+            while position < end and 0x30 <= head[position] <= 0x39:  # Digits
+                position += 1
+            if position >= end:
+                return None  # Number may continue in next piece
+            if position == start or head[position] not in _WHITESPACE:
+                raise ValueError(f'Broken {bytes(head[:2])} header')
+            values.append(int(head[start:position]))
+
+    return (values, position + 1)
+
+
+""" ╔════════════╗
+    ║ PBM tables ║
+    ╚════════════╝ """
+# ↓ P1 '0' (ink off) to 255, '1' (ink on) to 0, 8 bit L as pnm2list returns
+_P1_LEVELS = bytes.maketrans(b'01', b'\xff\x00')
+
+# ↓ 8 bit L below half to '1' (ink on), the rest to '0' (ink off), for list2pbm
+_PBM_INK = bytes(0x31 if level < 128 else 0x30 for level in range(256))
+
+_pbm_unpack: list[bytes] = []
+
+
+def _pbm_unpack_table() -> list[bytes]:
+    """Return list of 256 byte strings, each unpacking P4 byte to 8 inverted 8 bit L bytes, built on first call."""
+
+    if not _pbm_unpack:
+        _pbm_unpack.extend(bytes(0 if byte & (0x80 >> bit) else 255 for bit in range(8)) for byte in range(256))
+    return _pbm_unpack
+
+
+def _p4_rows(full_bytes: bytes | mmap.mmap, offset: int, X: int, Y: int) -> Iterator[list[list[int]]]:
+    """Yield Y rows of P4 image from ``offset`` on, as 8 bit L."""
+
+    # ↓ Unpacking bytes to 8 bit L bytes, 8 per byte, by table,
+    #   inverting ink on/off to L, cutting junk at row end off.
+    row_width = (X + 7) // 8  # Rounded up version of width, to get whole bytes including junk at EOLNs
+    unpack = _pbm_unpack_table().__getitem__
+    for y in range(Y):
+        start = offset + y * row_width
+        row = b''.join(map(unpack, full_bytes[start : start + row_width]))
+        yield [[value] for value in row[:X]]
+
+
+""" ╔═════════════════╗
+    ║ ASCII tokenizer ║
+    ╚═════════════════╝ """
+
+
+def _ascii_values(full_bytes: bytes | mmap.mmap, offset: int, piece: int = 2**20) -> Iterator[int]:
+    """Yield ints from ASCII PNM data, starting at ``offset``, piece by piece.
+
+    Pieces are cut at line end, so numbers and comments are never split;
+    comments (from ``#`` to line end) are allowed anywhere.
+
+    """
+
+    end = len(full_bytes)
+    position = offset
+    tail = b''
+    while position < end:
+        chunk = tail + full_bytes[position : position + piece]
+        position += piece
+        if position < end:
+            # ↓ Cutting at last line end, or, if line is longer than piece,
+            #   at last space unless comment is to be cut
+            cut = chunk.rfind(b'\n') + 1 or (b'#' not in chunk and chunk.rfind(b' ') + 1)
+            chunk, tail = chunk[:cut], chunk[cut:]
+        if b'#' in chunk:
+            chunk = sub(rb'#[^\r\n]*', b'', chunk)
+        yield from map(int, chunk.split())
+
+
+def _ascii_rows(full_bytes: bytes | mmap.mmap, offset: int, X: int, Y: int, Z: int, maxcolors: int) -> Iterator[list[list[int]]]:
+    """Yield Y rows of P3 or P2 image, parsed from ``offset`` on."""
+
+    values = _ascii_values(full_bytes, offset)
+    if maxcolors > 255:
+        values = map(_short_ints().__getitem__, values)  # 16 bpc values shared
+    # ↓ Same iterator zipped Z times groups values into pixels, through all rows
+    pixels = zip(*[values] * Z)
+    for y in range(Y):
+        row = list(map(list, islice(pixels, X)))
+        if len(row) < X:
+            raise ValueError(f'Image data end in row {y} of {Y}')
+        yield row
+
+
+_ascii_tables: dict[int, tuple[list[str], list[str]]] = {}
+
+
+def _ascii_samples(maxcolors: int) -> tuple[list[str], list[str]]:
+    """Return lists of ASCII PNM samples from 0 to ``maxcolors``, each followed by space,
+    without and with preceding line break, built on first call for each ``maxcolors``."""
+
+    if maxcolors not in _ascii_tables:
+        plain = [f'{value} ' for value in range(maxcolors + 1)]
+        _ascii_tables[maxcolors] = (plain, [f'\n{sample}' for sample in plain])
+    return _ascii_tables[maxcolors]
+
 
 """ ╔══════════════════════════════╗
     ║           pnm2list           ║
@@ -122,10 +497,12 @@ from re import search, sub
     ╚══════════════════════════════╝ """
 
 
-def pnm2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]]]:
-    """Read PBM, PGM or PPM file to nested image data list.
+def pnm2list(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[int, int, int, int, list[list[list[int]]]]:
+    """Read PBM, PGM, PPM or PAM file to nested image data list.
 
-    :param str in_filename: input file name;
+    :param in_filename: input file name, or bytes-like object holding PNM
+        (used without copying), or binary file object (*e.g.* ``BytesIO``);
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
     :return X, Y, Z, maxcolors, list_3d: tuple, consisting of:
 
     - ``X``, ``Y``, ``Z``: PNM image dimensions (int);
@@ -140,99 +517,23 @@ def pnm2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]
         │ IF Binary continuous tone │
         └───────────────────────────┘ """
 
-    def _p65(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]]]:
-        """Open P6 and P5 PNM."""
-        with open(in_filename, 'rb') as file:  # Open file for mmap
-            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as full_bytes_mmap:
-                # ↓ Getting header by pattern
-                header = search(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    full_bytes_mmap,
-                ).groups()
-
-                # ↓ Splitting header into image properties values
-                magic, X, Y, maxcolors = header
-                magic = (magic.split()[0]).decode('ascii')
-                X = int(X)
-                Y = int(Y)
-                Z = 3 if magic == 'P6' else 1  # assuming P5 is the only alternative to P6
-                maxcolors = int(maxcolors)
-
-                # ↓ Removing header by the same pattern, leaving only image data
-                filtered_bytes = sub(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # pattern to replace to
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    b'',  # empty space to replace pattern with
-                    full_bytes_mmap,
-                )
-        # ↑ got copy of file without header as `filtered_bytes` bytes
-
-        # ↓ Converting bytes to array
-        if maxcolors < 256:
-            array_1d = array.array('B', filtered_bytes)
-        else:
-            array_1d = array.array('H', filtered_bytes)
-            array_1d.byteswap()  # Critical for 16 bits per channel
-        del filtered_bytes  # Cleanup
+    def _p65(full_bytes: bytes | bytearray | mmap.mmap) -> tuple[int, int, int, int, list[list[list[int]]]]:
+        """Open P6, P5 and P7 PNM."""
+        # ↓ Slicing rows straight from mmap or buffer, no copy of whole file
+        with PnmImage(full_bytes) as image:
+            list_3d = list(image.rows())
 
-        # ↓ Converting array to list
-        list_1d = array_1d.tolist()
-        del array_1d  # Cleanup
-
-        # ↓ Reshaping flat 1D list to 3D list
-        list_3d = [[[list_1d[z + x * Z + y * X * Z] for z in range(Z)] for x in range(X)] for y in range(Y)]
-        del list_1d  # Cleanup
-
-        return (X, Y, Z, maxcolors, list_3d)
+        return (image.X, image.Y, image.Z, image.maxcolors, list_3d)
 
     """ ┌──────────────────────────┐
         │ IF ASCII continuous tone │
         └──────────────────────────┘ """
 
-    def _p32(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]]]:
+    def _p32(full_bytes: bytes | bytearray | mmap.mmap) -> tuple[int, int, int, int, list[list[list[int]]]]:
         """Open P3 and P2 PNM."""
-        with open(in_filename, 'r') as file:  # Open file for mmap
-            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as full_bytes_mmap:
-                # ↓ Getting header by pattern
-                header = search(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    full_bytes_mmap,
-                ).groups()
-
-                # ↓ Splitting header into image properties values
-                magic, X, Y, maxcolors = header
-                magic = (magic.split()[0]).decode('ascii')
-                X = int(X)
-                Y = int(Y)
-                Z = 3 if (magic == 'P3') else 1  # assuming P2 is the only alternative to P3
-                maxcolors = int(maxcolors)
-
-                # ↓ Removing header by the same pattern, leaving only image data
-                filtered_chars = sub(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # pattern to replace to
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    b'',  # empty space to replace pattern with
-                    full_bytes_mmap,
-                ).decode('ascii')
-        # ↑ got copy of file without header as `filtered_chars` str
-
-        # ↓ Converting to 1D list of strings, ignoring any formatting
-        list_1d = filtered_chars.split()
-        del filtered_chars  # Cleanup
-
-        # ↓ Converting 1D list of strings to 3D list of int
-        list_3d = [[[int(list_1d[z + x * Z + y * X * Z]) for z in range(Z)] for x in range(X)] for y in range(Y)]
-        del list_1d  # Cleanup
+        X, Y, Z, maxcolors, offset = _p65_header(full_bytes)  # Same header as P6/P5
+        # ↓ Parsing numbers piece by piece, never holding all tokens
+        list_3d = list(_ascii_rows(full_bytes, offset, X, Y, Z, maxcolors))
 
         return (X, Y, Z, maxcolors, list_3d)
 
@@ -240,52 +541,13 @@ def pnm2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]
         │ IF Binary 1 Bit/pixel │
         └───────────────────────┘ """
 
-    def _p4(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]]]:
+    def _p4(full_bytes: bytes | bytearray | mmap.mmap) -> tuple[int, int, int, int, list[list[list[int]]]]:
         """Open P4 PNM."""
-        with open(in_filename, 'rb') as file:  # Open file for mmap
-            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as full_bytes_mmap:
-                # ↓ Getting header by pattern. Note that for 1 bit pattern does not include maxcolors
-                header = search(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
-                    rb'\s*(\d+)\s)',
-                    full_bytes_mmap,
-                ).groups()
-
-                # ↓ Splitting header into image properties values
-                magic, X, Y = header
-                magic = (magic.split()[0]).decode('ascii')
-                X = int(X)
-                Y = int(Y)
-                Z = 1
-                maxcolors = 255  # Forcing conversion to 8 bit L
-
-                # ↓ Removing header by the same pattern, leaving only image data
-                filtered_bytes = sub(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # pattern to replace to
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    b'',  # empty space to replace pattern with
-                    full_bytes_mmap,
-                )
-        # ↑ got copy of file without header as `filtered_bytes` bytes
-
-        # ↓ Converting packed bits from bytes to 3D list of int, inverting values,
-        #   and multiplying by maxcolors to obtain 8 bit L.
-        row_width = (X + 7) // 8  # Rounded up version of width, to get whole bytes including junk at EOLNs
-        list_3d = []
-        for y in range(Y):
-            row = []
-            for x in range(row_width):
-                single_byte = filtered_bytes[(y * row_width) + x]
-                # ↓ Unpacking bytes to int(bits), including artificial junk in a last one in a row
-                single_byte_bits = [int(bit) for bit in bin(single_byte)[2:].zfill(8)]
-                # ↓ renormalizing colors from ink on/off to L model, replacing int with [int]
-                single_byte_bits_normalized = [[maxcolors * (1 - c)] for c in single_byte_bits]
-                # ↓ assembling row, junk at the end included
-                row.extend(single_byte_bits_normalized)
-            # ↓ Assembling image from rows, cutting junk off in the process
-            list_3d.append(row[0:X])
+        X, Y, offset = _p41_header(full_bytes)
+        Z = 1
+        maxcolors = 255  # Forcing conversion to 8 bit L
+
+        list_3d = list(_p4_rows(full_bytes, offset, X, Y))
 
         return (X, Y, Z, maxcolors, list_3d)
 
@@ -293,44 +555,19 @@ def pnm2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]
         │ IF ASCII 1 Bit/pixel │
         └──────────────────────┘ """
 
-    def _p1(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]]]:
+    def _p1(full_bytes: bytes | bytearray | mmap.mmap) -> tuple[int, int, int, int, list[list[list[int]]]]:
         """Open P1 PNM."""
-        with open(in_filename, 'r') as file:  # Open file for mmap
-            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as full_bytes_mmap:
-                # ↓ Getting header by pattern. Note that for 1 bit pattern does not include maxcolors
-                header = search(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # last \s gives better compatibility than [\r\n]
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'  # first \s further improves compatibility
-                    rb'\s*(\d+)\s)',
-                    full_bytes_mmap,
-                ).groups()
-
-                # ↓ Splitting header into image properties values
-                magic, X, Y = header
-                magic = magic.split()[0].decode('ascii')
-                X = int(X)
-                Y = int(Y)
-                Z = 1
-                maxcolors = 255  # Forcing conversion to 8 bit L
-
-                # ↓ Removing header by the same pattern, leaving only image data
-                filtered_chars = sub(
-                    rb'(^P\d\s(?:\s*#.*\s)*'  # pattern to replace to
-                    rb'\s*(\d+)\s(?:\s*#.*\s)*'
-                    rb'\s*(\d+)\s)',
-                    b'',  # empty space to replace pattern with
-                    full_bytes_mmap,
-                ).decode('ascii')
-        # ↑ got copy of file without header as `filtered_chars` str
-
-        # ↓ Converting to single str, removing any formatting
-        str_1d = ''.join(filtered_chars.split())
-        del filtered_chars  # Cleanup
-
-        # ↓ Converting str to 3D list of int,
-        #   inverting values and multiplying by maxcolors to obtain 8 bit L.
-        list_3d = [[[maxcolors * (1 - int(str_1d[x + y * X]))] for x in range(X)] for y in range(Y)]
-        del str_1d  # Cleanup
+        X, Y, offset = _p41_header(full_bytes)
+        Z = 1
+        maxcolors = 255  # Forcing conversion to 8 bit L
+
+        # ↓ Translating '0' and '1' to inverted 8 bit L bytes,
+        #   removing any formatting in the same pass.
+        levels = full_bytes[offset:].translate(_P1_LEVELS, b' \t\n\v\f\r')
+
+        # ↓ Converting bytes to 3D list of int
+        list_3d = [[[value] for value in levels[y * X : (y + 1) * X]] for y in range(Y)]
+        del levels  # Cleanup
 
         return (X, Y, Z, maxcolors, list_3d)
 
@@ -338,31 +575,384 @@ def pnm2list(in_filename: str) -> tuple[int, int, int, int, list[list[list[int]]
         │ PNM header type switch. │
         │   Format check ensued.  │
         └─────────────────────────┘ """
-    with open(in_filename, 'rb') as file:  # Open file in binary mode
-        beginnings = file.read(2)  # Read first two bytes 'Pn' and close file
-
-    if beginnings.startswith(b'P6'):  # Binary PPM
-        return _p65(in_filename)
-    elif beginnings.startswith(b'P5'):  # Binary PGM
-        return _p65(in_filename)
-    elif beginnings.startswith(b'P4'):  # Binary PBM
-        return _p4(in_filename)
-    elif beginnings.startswith(b'P3'):  # ASCII PPM
-        return _p32(in_filename)
-    elif beginnings.startswith(b'P2'):  # ASCII PGM
-        return _p32(in_filename)
-    elif beginnings.startswith(b'P1'):  # ASCII PBM
-        return _p1(in_filename)
-    else:
-        raise ValueError(f'Header {beginnings} is not in P1:P6 range')
+    with _pnm_source(in_filename) as full_bytes:  # File mapped, or buffer as is
+        beginnings = bytes(full_bytes[:2])  # First two bytes 'Pn'
+
+        if beginnings.startswith(b'P6'):  # Binary PPM
+            return _p65(full_bytes)
+        elif beginnings.startswith(b'P5'):  # Binary PGM
+            return _p65(full_bytes)
+        elif beginnings.startswith(b'P4'):  # Binary PBM
+            return _p4(full_bytes)
+        elif beginnings.startswith(b'P3'):  # ASCII PPM
+            return _p32(full_bytes)
+        elif beginnings.startswith(b'P2'):  # ASCII PGM
+            return _p32(full_bytes)
+        elif beginnings.startswith(b'P1'):  # ASCII PBM
+            return _p1(full_bytes)
+        elif beginnings.startswith(b'P7'):  # PAM
+            return _p65(full_bytes)
+        else:
+            raise ValueError(f'Header {beginnings} is not in P1:P7 range')
 # ↑ End of pnm2list PNM reading function
 
 
+""" ╔═══════════╗
+    ║ pnm2array ║
+    ╚═══════════╝ """
+
+
+def pnm2array(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[int, int, int, int, array.array]:
+    """Read binary PGM, PPM or PAM file to flat array.
+
+    Flat array takes about one tenth of memory of nested list
+    and is read several times faster, suitable for further processing
+    by array-aware code. Value of channel ``z`` of pixel ``x`` in row ``y``
+    is ``array_1d[z + x * Z + y * X * Z]``.
+
+    :param in_filename: input file name, or bytes-like object, or binary
+        file object, the same as for ``pnm2list``;
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :raises ValueError: File is not P5, P6 or P7 PNM, or header is broken;
+    :return X, Y, Z, maxcolors, array_1d: tuple, consisting of:
+
+    - ``X``, ``Y``, ``Z``, ``maxcolors``: the same as ``pnm2list`` returns;
+    - ``array_1d``: array of either 'B' (8 bpc), or 'H' (16 bpc) type,
+      in native byte order.
+
+    """
+
+    with _pnm_source(in_filename) as full_bytes:  # File mapped, or buffer as is
+        X, Y, Z, maxcolors, offset = _binary_header(full_bytes)
+
+        # ↓ Single copy of image data from mmap or buffer to array
+        array_1d = array.array('B' if maxcolors < 256 else 'H')
+        with memoryview(full_bytes) as data:
+            array_1d.frombytes(data[offset : offset + X * Y * Z * array_1d.itemsize])
+
+    if maxcolors > 255 and byteorder == 'little':
+        array_1d.byteswap()  # PNM is big-endian
+
+    return (X, Y, Z, maxcolors, array_1d)
+
+
+""" ╔══════════╗
+    ║ PnmImage ║
+    ╚══════════╝ """
+
+
+def _binary_row(row: bytes | memoryview, Z: int, maxcolors: int) -> list[list[int]]:
+    """Convert one row of binary PNM data to list (row) of lists (pixels) of ints (channels)."""
+
+    if maxcolors < 256:
+        values = iter(row)
+    else:
+        row_array = array.array('H')
+        row_array.frombytes(row)
+        if byteorder == 'little':
+            row_array.byteswap()  # PNM is big-endian
+        values = map(_short_ints().__getitem__, row_array)  # 16 bpc values shared
+    # ↓ Same iterator zipped Z times groups row values into pixels
+    return list(map(list, zip(*[values] * Z)))
+
+
+class PnmImage:
+    """Binary PGM, PPM or PAM file, mapped to memory (or buffer), and read row by row on demand.
+
+    Only rows requested are converted to lists, so image of any size
+    may be processed with a few rows resident, *e.g.*::
+
+        with PnmImage(in_filename) as image:
+            rows2pnm(out_filename, image.X, image.Y, image.Z, image.maxcolors, image.rows())
+
+    Attributes ``X``, ``Y``, ``Z``, ``maxcolors`` are the same as
+    ``pnm2list`` returns; ``image[y]`` is row ``y`` as list (row)
+    of lists (pixels) of ints (channel values), the same as ``pnm2list`` row.
+
+    """
+
+    def __init__(self, in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO):
+        """Map file, or take buffer, and parse header.
+
+        :param in_filename: input file name, or bytes-like object holding PNM
+            (rows are sliced from it without copying), or binary file object;
+        :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+        :raises ValueError: File is not P5, P6 or P7 PNM, or header is broken,
+            or file is shorter than header claims.
+
+        """
+
+        self._buffer, self._mapped = _source_buffer(in_filename)
+        try:
+            self.X, self.Y, self.Z, self.maxcolors, self._offset = _binary_header(self._buffer)
+            # ↓ Row length in bytes, 16 bpc takes two bytes per value
+            self._row_bytes = self.X * self.Z * (1 if self.maxcolors < 256 else 2)
+            if self._offset + self.Y * self._row_bytes > len(self._buffer):
+                raise ValueError(f'{in_filename if isinstance(in_filename, (str, PathLike)) else "Image"} is truncated')
+        except ValueError:
+            if self._mapped:
+                self._buffer.close()
+            raise
+        self._data = memoryview(self._buffer)
+
+    def __len__(self) -> int:
+        return self.Y
+
+    def __getitem__(self, y: int) -> list[list[int]]:
+        """Read row ``y``, negative ``y`` counting from image bottom."""
+
+        if y < 0:
+            y += self.Y
+        if not 0 <= y < self.Y:
+            raise IndexError(f'Row {y} out of image height {self.Y}')
+        start = self._offset + y * self._row_bytes
+        with self._data[start : start + self._row_bytes] as row:
+            return _binary_row(row, self.Z, self.maxcolors)
+
+    def rows(self, start: int = 0, stop: int | None = None) -> Iterator[list[list[int]]]:
+        """Yield rows from ``start`` to ``stop`` (None meaning image end), one by one."""
+
+        for y in range(start, self.Y if stop is None else min(stop, self.Y)):
+            yield self[y]
+
+    def close(self) -> None:
+        """Release file mapping or buffer; rows read so far stay valid."""
+
+        self._data.release()
+        if self._mapped:
+            self._buffer.close()
+
+    def __enter__(self) -> 'PnmImage':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+""" ╔══════════╗
+    ║ pnm_rows ║
+    ╚══════════╝ """
+
+
+def pnm_rows(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[int, int, int, int, Iterator[list[list[int]]]]:
+    """Take PNM filename and return PNM data with rows generator.
+
+    File is mapped to memory and rows are parsed one by one as they are
+    requested, so memory is bounded by a few rows, independent of image size.
+    ASCII numbers are tokenized piece by piece, never holding the whole file
+    as str or list of tokens. Rows are the same as ``pnm2list`` returns.
+
+    :param in_filename: input file name, or bytes-like object, or binary
+        file object, the same as for ``pnm2list``;
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :raises ValueError: File is not P2:P7 PNM (ASCII PBM rows are not supported),
+        or header is broken;
+    :return X, Y, Z, maxcolors, rows: tuple, consisting of:
+
+    - ``X``, ``Y``, ``Z``, ``maxcolors``: the same as ``pnm2list`` returns;
+    - ``rows``: generator, yielding Y rows, each being list (row) of lists (pixels)
+      of ints (channel values).
+
+    """
+
+    full_bytes, mapped = _source_buffer(in_filename)  # File mapped, or buffer as is
+    magic = bytes(full_bytes[:2])  # First two bytes 'Pn'
+    image = None
+
+    try:
+        if magic in (b'P6', b'P5', b'P7'):
+            image = PnmImage(full_bytes)
+            X, Y, Z, maxcolors = image.X, image.Y, image.Z, image.maxcolors
+            source = image.rows()
+        elif magic == b'P4':
+            X, Y, offset = _p41_header(full_bytes)
+            Z = 1
+            maxcolors = 255  # Forcing conversion to 8 bit L
+            source = _p4_rows(full_bytes, offset, X, Y)
+        elif magic in (b'P3', b'P2'):
+            X, Y, Z, maxcolors, offset = _p65_header(full_bytes)  # Same header as P6/P5
+            source = _ascii_rows(full_bytes, offset, X, Y, Z, maxcolors)
+        else:
+            raise ValueError(f'Header {magic} is not in P2:P7 range')
+    except ValueError:
+        if mapped:
+            full_bytes.close()
+        raise
+
+    def rows() -> Iterator[list[list[int]]]:
+        """Yield rows, releasing file mapping after the last one."""
+        try:
+            yield from source
+        finally:
+            if image is not None:
+                image.close()  # Row view released before mapping
+            if mapped:
+                full_bytes.close()
+
+    return (X, Y, Z, maxcolors, rows())
+
+
+""" ╔════════════╗
+    ║ pnm_frames ║
+    ╚════════════╝ """
+
+
+def pnm_frames(in_file: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> Iterator[tuple[int, int, int, int, list[list[list[int]]]]]:
+    """Read binary PNM images following one another in a file or stream.
+
+    Netpbm allows several binary images concatenated in one file or pipe,
+    as emulators and video tools dump frame sequences; images may differ
+    in format and size. Stream is read image by image, so only one image
+    is held in memory, and stream is opened once for all images.
+
+    :param in_file: input file name, or bytes-like object holding images,
+        or binary file object (*e.g.* ``sys.stdin.buffer``);
+    :type in_file: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :raises ValueError: Image is not P4:P7 PNM (plain PNM holds single image
+        by specification), or header is broken, or stream ends within image.
+    :return: generator, yielding ``(X, Y, Z, maxcolors, list_3d)`` tuple,
+        the same as ``pnm2list`` returns, for every image in turn.
+
+    """
+
+    if isinstance(in_file, (str, PathLike)):
+        with open(in_file, 'rb') as file:
+            yield from pnm_frames(file)
+        return
+    if isinstance(in_file, (bytes, bytearray, memoryview)):
+        yield from pnm_frames(BytesIO(in_file))
+        return
+
+    buffer = b''
+    while True:
+        # ↓ Reading by pieces until header is complete, or stream is over
+        while True:
+            buffer = buffer.lstrip()  # Some tools separate images with line break
+            if buffer[:1] not in (b'', b'P') or buffer[1:2] not in b'4567':
+                raise ValueError(f'Header {buffer[:2]} is not in P4:P7 range')
+            packed = buffer[:2] == b'P4'  # PBM, 8 pixels per byte
+            if buffer[:2] == b'P7':
+                # ↓ PAM header is complete with ENDHDR line
+                end = buffer.find(b'ENDHDR')
+                if end >= 0 and buffer.find(b'\n', end) >= 0:
+                    X, Y, Z, maxcolors, offset = _p7_header(buffer)
+                    size = X * Y * Z * (1 if maxcolors < 256 else 2)
+                    break
+            elif len(buffer) > 2:
+                header = _header_tokens(buffer, 2 if packed else 3)
+                if header is not None:
+                    if packed:
+                        (X, Y), offset = header
+                        Z, maxcolors, size = 1, 255, (X + 7) // 8 * Y
+                    else:
+                        (X, Y, maxcolors), offset = header
+                        Z = 3 if buffer[:2] == b'P6' else 1
+                        size = X * Y * Z * (1 if maxcolors < 256 else 2)
+                    break
+            piece = in_file.read(4096)
+            if not piece:
+                if buffer:
+                    raise ValueError(f'Stream ends within {bytes(buffer[:2])} header')
+                return  # Stream ended cleanly between images
+            buffer += piece
+
+        # ↓ Image data go to preallocated array, the part read with header first
+        data = bytearray(size)
+        filled = min(size, len(buffer) - offset)
+        data[:filled] = buffer[offset : offset + filled]
+        buffer = buffer[offset + filled :]
+        with memoryview(data) as view:
+            while filled < size:
+                received = in_file.readinto(view[filled:])
+                if not received:
+                    raise ValueError(f'Stream ends within {X}x{Y} image')
+                filled += received
+
+            if packed:
+                list_3d = list(_p4_rows(data, 0, X, Y))
+            else:
+                row_bytes = size // Y if Y else 0
+                list_3d = [_binary_row(view[y * row_bytes : (y + 1) * row_bytes], Z, maxcolors) for y in range(Y)]
+        del data  # Cleanup
+
+        yield (X, Y, Z, maxcolors, list_3d)
+
+
+""" ╔═══════════╗
+    ║ pnm_probe ║
+    ╚═══════════╝ """
+
+
+def pnm_probe(in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO) -> tuple[int, int, int, int]:
+    """Read PBM, PGM, PPM or PAM file header only.
+
+    :param in_filename: input file name, or bytes-like object holding PNM,
+        or binary file object, header being read from its current position;
+    :type in_filename: str | PathLike | bytes | bytearray | memoryview | BinaryIO
+    :raises ValueError: File is not P1:P7 PNM, or header is broken;
+    :return X, Y, Z, maxcolors: tuple, the same as first four values
+        ``pnm2list`` would return for the same file.
+
+    """
+
+    if isinstance(in_filename, (str, PathLike)):
+        with open(in_filename, 'rb') as file:
+            return pnm_probe(file)
+
+    if isinstance(in_filename, (bytes, bytearray, memoryview)):
+        # ↓ Whole PNM at hand, parsing header in place
+        full_bytes = _source_buffer(in_filename)[0]  # Never mapped for buffer
+        magic = bytes(full_bytes[:2])
+        if magic == b'P7':
+            X, Y, Z, maxcolors, offset = _p7_header(full_bytes)
+        elif magic in (b'P1', b'P4'):
+            X, Y, offset = _p41_header(full_bytes)
+            Z, maxcolors = 1, 255  # PBM gets promoted to 8 bit L by pnm2list
+        elif magic in (b'P2', b'P3', b'P5', b'P6'):
+            X, Y, Z, maxcolors, offset = _p65_header(full_bytes)
+        else:
+            raise ValueError(f'Header {magic} is not in P1:P7 range')
+        return (X, Y, Z, maxcolors)
+
+    file = in_filename
+    head = file.read(2)
+    if head[:1] != b'P' or head[1:2] not in b'1234567':
+        raise ValueError(f'Header {head} is not in P1:P7 range')
+
+    if head == b'P7':
+        # ↓ Reading by small pieces until header end
+        while b'ENDHDR' not in head:
+            piece = file.read(1024)
+            if not piece:
+                break
+            head += piece
+        X, Y, Z, maxcolors, offset = _p7_header(head + b'\n')
+        return (X, Y, Z, maxcolors)
+
+    # ↓ Reading by small pieces until header numbers are complete,
+    #   comments may make header of any length
+    pbm = head in (b'P1', b'P4')
+    header = _header_tokens(head, 2 if pbm else 3)
+    while header is None:
+        piece = file.read(1024)
+        if not piece:
+            raise ValueError(f'Broken {head[:2]} header')
+        head += piece
+        header = _header_tokens(head, 2 if pbm else 3)
+
+    X, Y = header[0][:2]
+    Z = 3 if head[:2] in (b'P3', b'P6') else 1
+    # ↓ PBM gets promoted to 8 bit L by pnm2list
+    maxcolors = 255 if pbm else header[0][2]
+
+    return (X, Y, Z, maxcolors)
+
+
 """ ╔══════════╗
     ║ list2bin ║
     ╚══════════╝ """
 
-def list2bin(list_3d: list[list[list[int]]], maxcolors: int, show_chessboard: bool = False) -> bytes:
+def list2bin(list_3d: list[list[list[int]]], maxcolors: int, show_chessboard: bool = False, reduce_depth: bool = False) -> bytes:
     """Convert nested image data list to PGM P5 or PPM P6 bytes in memory.
 
     :param list_3d: image as list (image) of lists (rows) of lists (pixels)
@@ -372,6 +962,8 @@ def list2bin(list_3d: list[list[list[int]]], maxcolors: int, show_chessboard: bo
         either 255, or 65535;
     :param bool show_chessboard: if set ``True`` and alpha channel exist,
         render preview against chessboard, otherwise skip alpha;
+    :param bool reduce_depth: if set ``True``, 16 bpc image is converted
+        to 8 bpc, which is enough for preview and is twice smaller;
     :return: PNM-like object in memory.
     :rtype: bytes
 
@@ -380,46 +972,68 @@ def list2bin(list_3d: list[list[list[int]]], maxcolors: int, show_chessboard: bo
     # ↓ Image X, Y, Z sizes
     Y, X, Z = (len(list_3d), len(list_3d[0]), len(list_3d[0][0]))
 
-    def _chess(x: int, y: int) -> int:
-        """Chessboard pattern, size and color match Photoshop 7.0.
-
-        Photoshop chess pattern preset parameters:
-        - Small: 4 px | Medium: 8 px | Large: 16 px;
-        - Light: (0.8, 1.0) | Medium: (0.4, 0.6) | Dark: (0.2, 0.4) of ``maxcolors``.
-
-        """
-
-        if X < 65 or Y < 65:
-            chess_size = 4
-        elif X > 512 or Y > 512:
-            chess_size = 16
-        else:
-            chess_size = 8
-        return int(maxcolors * 0.8) if ((y // chess_size) % 2) == ((x // chess_size) % 2) else maxcolors
-
     magic = 'P5' if Z < 3 else 'P6'  # PGM or PPM
+    datatype = 'B' if maxcolors < 256 else 'H'
 
     if Z == 3 or Z == 1:  # Source has no alpha
         Z_READ = Z  # Number of color channels
-        # ↓ Generator: Flattening 3D list to 1D list
-        list_1d = (list_3d[y][x][z] for y in range(Y) for x in range(X) for z in range(Z_READ))
+        # ↓ Flattening 3D list to 1D array at C level
+        content = array.array(datatype, chain.from_iterable(chain.from_iterable(list_3d)))
     else:  # Source has alpha
         Z_READ = min(Z, 4) - 1  # Number of color channels without alpha; clipping anything above RGB off
 
         if show_chessboard:
-            # ↓ Generator: Flattening 3D list to 1D list, mixing with chessboard
-            list_1d = ((((list_3d[y][x][z] * list_3d[y][x][Z_READ]) + (_chess(x, y) * (maxcolors - list_3d[y][x][Z_READ]))) // maxcolors) for y in range(Y) for x in range(X) for z in range(Z_READ))
+            content = array.array(datatype)
+
+            """ Chessboard pattern, size and color match Photoshop 7.0.
+                Photoshop chess pattern preset parameters:
+                - Small: 4 px | Medium: 8 px | Large: 16 px;
+                - Light: (0.8, 1.0) | Medium: (0.4, 0.6) | Dark: (0.2, 0.4) of ``maxcolors``.
+            """
+            if X < 65 or Y < 65:
+                chess_size = 4
+            elif X > 512 or Y > 512:
+                chess_size = 16
+            else:
+                chess_size = 8
+            dark = int(maxcolors * 0.8)
+            # ↓ Chessboard rows, one value per pixel; rows of odd squares start with light square
+            chess_row = [dark if (x // chess_size) % 2 == 0 else maxcolors for x in range(X)]
+            chess_rows = (chess_row, [dark + maxcolors - chess for chess in chess_row])
+            # ↓ The same, one value per sample, for fully transparent rows
+            chess_samples = tuple(array.array(datatype, (chess for chess in row for z in range(Z_READ))) for row in chess_rows)
+
+            for y, row in enumerate(list_3d):
+                odd = (y // chess_size) % 2
+                alphas = [pixel[Z_READ] for pixel in row]
+                if min(alphas) == maxcolors:
+                    # ↓ Opaque row, skipping alpha
+                    content.extend(chain.from_iterable(pixel[:Z_READ] for pixel in row))
+                elif max(alphas) == 0:
+                    # ↓ Transparent row, chessboard only
+                    content.extend(chess_samples[odd])
+                else:
+                    # ↓ Mixing with chessboard, opaque pixels taken as is
+                    content.extend(
+                        color if alpha == maxcolors else (color * alpha + chess * (maxcolors - alpha)) // maxcolors
+                        for pixel, alpha, chess in zip(row, alphas, chess_rows[odd])
+                        for color in pixel[:Z_READ]
+                    )
         else:
-            # ↓ Generator: Flattening 3D list to 1D list, skipping alpha
-            list_1d = (list_3d[y][x][z] for y in range(Y) for x in range(X) for z in range(Z_READ))
-
-    if maxcolors < 256:
-        content = array.array('B', list_1d)  # Bytes
+            # ↓ Flattening 3D list to 1D array, skipping alpha
+            content = array.array(datatype, chain.from_iterable(pixel[:Z_READ] for row in list_3d for pixel in row))
+
+    if maxcolors > 255 and reduce_depth:
+        # ↓ Taking high byte of every 16 bit value
+        content_bytes = content.tobytes()
+        content_bytes = content_bytes[1::2] if byteorder == 'little' else content_bytes[::2]
+        maxcolors = 255
     else:
-        content = array.array('H', list_1d)  # Doubles
-        content.byteswap()  # Critical for 16 bits per channel
+        if maxcolors > 255 and byteorder == 'little':
+            content.byteswap()  # Critical for 16 bits per channel
+        content_bytes = content.tobytes()
 
-    return b''.join((f'{magic}\n{X} {Y}\n{maxcolors}\n'.encode('ascii'), content.tobytes()))
+    return b''.join((f'{magic}\n{X} {Y}\n{maxcolors}\n'.encode('ascii'), content_bytes))
 # ↑ End of 'list2bin' list to in-memory PNM conversion function
 
 
@@ -427,10 +1041,12 @@ def list2bin(list_3d: list[list[list[int]]], maxcolors: int, show_chessboard: bo
     ║ list2pnmbin ║
     ╚═════════════╝ """
 
-def list2pnmbin(out_filename: str, list_3d: list[list[list[int]]], maxcolors: int) -> None:
+def list2pnmbin(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], maxcolors: int) -> None:
     """Write binary PNM ``out_filename`` file; writing performed per row to reduce RAM usage.
 
-    :param str out_filename: name of the PNM file to be written;
+    :param out_filename: name of the PNM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
     :param list_3d: image as list (image) of lists (rows) of lists (pixels)
         of ints (channels);
     :type list_3d: list[list[list[int]]]
@@ -443,32 +1059,345 @@ def list2pnmbin(out_filename: str, list_3d: list[list[list[int]]], maxcolors: in
     # ↓ Image X, Y, Z sizes
     Y, X, Z = (len(list_3d), len(list_3d[0]), len(list_3d[0][0]))
 
+    rows2pnm(out_filename, X, Y, Z, maxcolors, list_3d)
+
+    return None
+# ↑ End of 'list2pnmbin' function writing binary PPM/PGM file
+
+
+""" ╔══════════╗
+    ║ list2pbm ║
+    ╚══════════╝ """
+
+
+def list2pbm(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], maxcolors: int) -> None:
+    """Write binary PBM (P4) ``out_filename`` file, packing 8 pixels per byte.
+
+    Pixel with first channel value below half of ``maxcolors`` becomes ink on,
+    the rest - ink off, so bilevel image read from PBM with ``pnm2list``
+    and scaled gets written back unchanged.
+
+    :param out_filename: name of the PBM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param list_3d: image as list (image) of lists (rows) of lists (pixels)
+        of ints (channels);
+    :type list_3d: list[list[list[int]]]
+    :param int maxcolors: number of colors per channel for current image,
+        either 255, or 65535.
+    :return: None
+
+    """
+
+    # ↓ Image X, Y sizes
+    Y, X = (len(list_3d), len(list_3d[0]))
+    row_width = (X + 7) // 8  # Rounded up version of width, to get whole bytes
+    padding = b'0' * (8 * row_width - X)  # Junk bits at row end
+
+    if isinstance(out_filename, (str, PathLike)):
+        with open(out_filename, 'wb') as file_pbm:
+            return list2pbm(file_pbm, list_3d, maxcolors)
+
+    out_filename.write(f'P4\n{X} {Y}\n'.encode('ascii'))  # Writing PBM header to file
+    for row in list_3d:
+        # ↓ First channel to 8 bit levels, then to '1'/'0' str of bits, then to packed int
+        levels = bytes(pixel[0] for pixel in row) if maxcolors < 256 else bytes(pixel[0] >> 8 for pixel in row)
+        bits = levels.translate(_PBM_INK) + padding
+        out_filename.write(int(bits, 2).to_bytes(row_width, 'big'))
+
+    return None
+# ↑ End of 'list2pbm' function writing binary PBM file
+
+
+""" ╔══════════╗
+    ║ rows2pnm ║
+    ╚══════════╝ """
+
+
+def _pnm_header(X: int, Y: int, Z: int, maxcolors: int) -> tuple[bytes, int]:
+    """Return binary PPM or PGM header, and number of channels to write, skipping alpha."""
+
     magic = 'P5' if Z < 3 else 'P6'  # PGM or PPM
     Z_READ = Z if Z == 3 or Z == 1 else min(Z, 4) - 1  # To skip alpha later; clipping anything above RGB off
-    datatype = 'B' if maxcolors < 256 else 'H'
+    return f'{magic}\n{X} {Y}\n{maxcolors}\n'.encode('ascii'), Z_READ
+
+
+def _row_array(row: list[list[int]], Z: int, Z_READ: int, maxcolors: int) -> array.array:
+    """Convert row of ``Z`` channel pixels to array of big-endian samples, first ``Z_READ`` channels only."""
+
+    # ↓ Flattening one row, joining pixels at C level if no channels skipped
+    if Z == Z_READ:
+        row_1d = chain.from_iterable(row)
+    else:
+        row_1d = (pixel[z] for pixel in row for z in range(Z_READ))
+    row_array = array.array('B' if maxcolors < 256 else 'H', row_1d)  # list[int] to array
+    if maxcolors > 255 and byteorder == 'little':
+        row_array.byteswap()  # Critical for 16 bits per channel
+    return row_array
+
+
+def _write_rows(file: BinaryIO, rows: Iterable[list[list[int]]], Z: int, Z_READ: int, maxcolors: int) -> int:
+    """Write rows of ``Z`` channel pixels as big-endian samples, first ``Z_READ`` channels only.
+
+    :return: number of rows written.
+
+    """
+
+    written = 0
+    for row in rows:
+        file.write(_row_array(row, Z, Z_READ, maxcolors))  # Writing row bytes array to file
+        written += 1
+    return written
+
+
+def rows2pnm(out_filename: str | PathLike | BinaryIO, X: int, Y: int, Z: int, maxcolors: int, rows: Iterable[list[list[int]]]) -> None:
+    """Write binary PNM ``out_filename`` file from rows coming one by one.
+
+    Rows are consumed as they come, so ``rows`` may be generator
+    (*e.g.* ``PnmImage.rows()`` or scaler yielding rows), keeping only
+    one row in memory.
+
+    :param out_filename: name of the PNM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param int X: image width, pixels;
+    :param int Y: image height, the number of rows ``rows`` yield;
+    :param int Z: channels per pixel; LA and RGBA alpha is skipped;
+    :param int maxcolors: number of colors per channel for current image,
+        either 255, or 65535;
+    :param rows: iterable of lists (rows) of lists (pixels) of ints (channels);
+    :type rows: Iterable[list[list[int]]]
+    :raises ValueError: ``rows`` yield other number of rows than ``Y``.
+    :return: None
+
+    """
+
+    if isinstance(out_filename, (str, PathLike)):
+        with open(out_filename, 'wb') as file_pnm:
+            return rows2pnm(file_pnm, X, Y, Z, maxcolors, rows)
+
+    header, Z_READ = _pnm_header(X, Y, Z, maxcolors)
+
+    out_filename.write(header)  # Writing PNM header to file
+    written = _write_rows(out_filename, rows, Z, Z_READ, maxcolors)
+    if written != Y:
+        raise ValueError(f'Got {written} rows instead of {Y}')
+
+    return None
+# ↑ End of 'rows2pnm' function writing binary PPM/PGM file row by row
+
 
+""" ╔══════════╗
+    ║ rows2pam ║
+    ╚══════════╝ """
+
+# ↓ PAM tuple types by channels number
+_PAM_TUPLTYPES = {1: 'GRAYSCALE', 2: 'GRAYSCALE_ALPHA', 3: 'RGB', 4: 'RGB_ALPHA'}
+
+
+def _pam_header(X: int, Y: int, Z: int, maxcolors: int) -> tuple[bytes, int]:
+    """Return PAM header, and number of channels to write, clipping anything above RGBA off."""
+
+    Z_READ = min(Z, 4)
+    header = f'P7\nWIDTH {X}\nHEIGHT {Y}\nDEPTH {Z_READ}\nMAXVAL {maxcolors}\nTUPLTYPE {_PAM_TUPLTYPES[Z_READ]}\nENDHDR\n'
+    return header.encode('ascii'), Z_READ
+
+
+def rows2pam(out_filename: str | PathLike | BinaryIO, X: int, Y: int, Z: int, maxcolors: int, rows: Iterable[list[list[int]]]) -> None:
+    """Write PAM (P7) ``out_filename`` file from rows coming one by one.
+
+    Unlike PPM and PGM, PAM keeps alpha, so L, LA, RGB and RGBA images
+    are written as is, uncompressed, to be read back by ``pnm2list``,
+    ``pnm_rows`` or ``PnmImage`` with no decompression cost.
+
+    :param out_filename: name of the PAM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param int X: image width, pixels;
+    :param int Y: image height, the number of rows ``rows`` yield;
+    :param int Z: channels per pixel; channels above 4-th are dropped;
+    :param int maxcolors: number of colors per channel for current image,
+        either 255, or 65535;
+    :param rows: iterable of lists (rows) of lists (pixels) of ints (channels);
+    :type rows: Iterable[list[list[int]]]
+    :raises ValueError: ``rows`` yield other number of rows than ``Y``.
+    :return: None
+
+    """
+
+    if isinstance(out_filename, (str, PathLike)):
+        with open(out_filename, 'wb') as file_pam:
+            return rows2pam(file_pam, X, Y, Z, maxcolors, rows)
+
+    header, Z_READ = _pam_header(X, Y, Z, maxcolors)
+
+    out_filename.write(header)  # Writing PAM header to file
+    written = _write_rows(out_filename, rows, Z, Z_READ, maxcolors)
+    if written != Y:
+        raise ValueError(f'Got {written} rows instead of {Y}')
+
+    return None
+# ↑ End of 'rows2pam' function writing PAM file row by row
+
+
+""" ╔══════════╗
+    ║ list2pam ║
+    ╚══════════╝ """
+
+
+def list2pam(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], maxcolors: int) -> None:
+    """Write PAM (P7) ``out_filename`` file, keeping alpha; writing performed per row to reduce RAM usage.
+
+    :param out_filename: name of the PAM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
+    :param list_3d: image as list (image) of lists (rows) of lists (pixels)
+        of ints (channels);
+    :type list_3d: list[list[list[int]]]
+    :param int maxcolors: number of colors per channel for current image,
+        either 255, or 65535.
+    :return: None
+
+    """
+
+    # ↓ Image X, Y, Z sizes
+    Y, X, Z = (len(list_3d), len(list_3d[0]), len(list_3d[0][0]))
+
+    rows2pam(out_filename, X, Y, Z, maxcolors, list_3d)
+
+    return None
+
+
+""" ╔════════════╗
+    ║ frames2pnm ║
+    ╚════════════╝ """
+
+
+def frames2pnm(out_file: str | PathLike | BinaryIO, frames: Iterable[tuple[list[list[list[int]]], int]], pam: bool = False) -> None:
+    """Write several images one after another to binary PNM file or stream.
+
+    Images are consumed as they come, so ``frames`` may be generator,
+    *e.g.* scaling images read by ``pnm_frames``, keeping only one image
+    in memory::
+
+        frames = ((scaleNx(list_3d, 2, False), maxcolors) for X, Y, Z, maxcolors, list_3d in pnm_frames(in_file))
+        frames2pnm(out_file, frames)
+
+    :param out_file: output file name, or binary file object
+        (*e.g.* ``sys.stdout.buffer``);
+    :type out_file: str | PathLike | BinaryIO
+    :param frames: iterable of ``(list_3d, maxcolors)`` tuples, ``list_3d``
+        being image as list (image) of lists (rows) of lists (pixels)
+        of ints (channels), and ``maxcolors`` either 255, or 65535;
+    :type frames: Iterable[tuple[list[list[list[int]]], int]]
+    :param bool pam: if True, write PAM (P7) images, keeping alpha,
+        otherwise PPM (P6) or PGM (P5) images.
+    :return: None
+
+    """
+
+    if isinstance(out_file, (str, PathLike)):
+        with open(out_file, 'wb') as file:
+            frames2pnm(file, frames, pam)
+        return None
+
+    for list_3d, maxcolors in frames:
+        # ↓ Image X, Y, Z sizes
+        Y, X, Z = (len(list_3d), len(list_3d[0]), len(list_3d[0][0]))
+        header, Z_READ = _pam_header(X, Y, Z, maxcolors) if pam else _pnm_header(X, Y, Z, maxcolors)
+        out_file.write(header)
+        _write_rows(out_file, list_3d, Z, Z_READ, maxcolors)
+
+    return None
+
+
+""" ╔══════════════╗
+    ║ pnm_allocate ║
+    ╚══════════════╝ """
+
+
+def pnm_allocate(out_filename: str, X: int, Y: int, Z: int, maxcolors: int, pam: bool = False) -> None:
+    """Create binary PNM ``out_filename`` file of full size, to be filled by ``band2pnm``.
+
+    Image data are not written, file is just extended to its final size
+    (sparse on most file systems), so allocating takes no time
+    whatever image size is.
+
+    :param str out_filename: name of the PNM file to be created;
+    :param int X: image width, pixels;
+    :param int Y: image height, pixels;
+    :param int Z: channels per pixel of image to be written;
+    :param int maxcolors: number of colors per channel for current image,
+        either 255, or 65535;
+    :param bool pam: if True, create PAM (P7) file, keeping alpha,
+        otherwise PPM (P6) or PGM (P5) file.
+    :return: None
+
+    """
+
+    header, Z_READ = _pam_header(X, Y, Z, maxcolors) if pam else _pnm_header(X, Y, Z, maxcolors)
     with open(out_filename, 'wb') as file_pnm:
-        file_pnm.write(f'{magic}\n{X} {Y}\n{maxcolors}\n'.encode('ascii'))  # Writing PNM header to file
-        for y in range(Y):
-            # ↓ Generator: Flattening one row
-            row_1d = (list_3d[y][x][z] for x in range(X) for z in range(Z_READ))
-            row_array = array.array(datatype, row_1d)  # list[int] to array
-            if maxcolors > 255:
-                row_array.byteswap()  # Critical for 16 bits per channel
-            file_pnm.write(row_array)  # Writing row bytes array to file
+        file_pnm.write(header)
+        file_pnm.truncate(len(header) + X * Y * Z_READ * (1 if maxcolors < 256 else 2))
 
     return None
-# ↑ End of 'list2pnmbin' function writing binary PPM/PGM file
+
+
+""" ╔══════════╗
+    ║ band2pnm ║
+    ╚══════════╝ """
+
+
+def band2pnm(out_filename: str, start: int, rows: Iterable[list[list[int]]]) -> int:
+    """Write rows to binary PNM ``out_filename`` file, created by ``pnm_allocate``, from row ``start`` on.
+
+    File is mapped to memory and every row goes straight to its place,
+    so several processes may write their bands of the same file at once,
+    with neither result gathering nor pickling in parent process::
+
+        pnm_allocate(out_filename, X, Y, Z, maxcolors)
+        # ↓ in every worker
+        band2pnm(out_filename, top, scaled_band)
+
+    :param str out_filename: name of the PNM file to be filled;
+    :param int start: number of the first row to write;
+    :param rows: iterable of lists (rows) of lists (pixels) of ints (channels),
+        pixels having the same or more channels than file;
+    :type rows: Iterable[list[list[int]]]
+    :raises ValueError: File is not P5, P6 or P7 PNM, or rows do not fit into image,
+        or row width differs from image width.
+    :return: number of rows written.
+
+    """
+
+    written = 0
+    with open(out_filename, 'r+b') as file:  # Open file for mmap
+        with mmap.mmap(file.fileno(), 0) as full_bytes_mmap:
+            X, Y, Z_FILE, maxcolors, offset = _binary_header(full_bytes_mmap)
+            row_bytes = X * Z_FILE * (1 if maxcolors < 256 else 2)
+            position = offset + start * row_bytes
+            for row in rows:
+                if not 0 <= start + written < Y:
+                    raise ValueError(f'Row {start + written} out of image height {Y}')
+                if len(row) != X:
+                    raise ValueError(f'Row {start + written} is {len(row)} px wide, image is {X}')
+                full_bytes_mmap[position : position + row_bytes] = _row_array(row, len(row[0]), Z_FILE, maxcolors)
+                position += row_bytes
+                written += 1
+
+    return written
 
 
 """ ╔═══════════════╗
     ║ list2pnmascii ║
     ╚═══════════════╝ """
 
-def list2pnmascii(out_filename: str, list_3d: list[list[list[int]]], maxcolors: int) -> None:
-    """Write ASCII PNM ``out_filename`` file; writing performed per sample to reduce RAM usage.
+def list2pnmascii(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], maxcolors: int) -> None:
+    """Write ASCII PNM ``out_filename`` file; writing performed per row to reduce RAM usage.
 
-    :param str out_filename: name of the PNM file to be written;
+    :param out_filename: name of the PNM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
     :param list_3d: image as list (image) of lists (rows) of lists (pixels)
         of ints (channels);
     :type list_3d: list[list[list[int]]]
@@ -488,16 +1417,27 @@ def list2pnmascii(out_filename: str, list_3d: list[list[list[int]]], maxcolors:
         magic = 'P3'
         Z_READ = 3
 
-    with open(out_filename, 'w') as file_pnm:
-        file_pnm.write(f'{magic}\n{X} {Y}\n{maxcolors}\n')  # Writing PNM header to file
-        sample_count = 0  # Start counting samples to break line <= 60 char
-        for y in range(Y):
-            for x in range(X):
-                for z in range(Z_READ):
-                    sample_count += 1
-                    if (sample_count % 3) == 0:  # 3 must fit any specs for line length
-                        file_pnm.write('\n')  # Writing break to fulfill specs line <= 60 char
-                    file_pnm.write(f'{list_3d[y][x][z]} ')  # Writing channel value to file
+    # ↓ Pre-rendered samples, followed by space, with and without preceding line break
+    plain, broken = _ascii_samples(maxcolors)
+
+    if isinstance(out_filename, (str, PathLike)):
+        with open(out_filename, 'wb') as file_pnm:
+            return list2pnmascii(file_pnm, list_3d, maxcolors)
+
+    out_filename.write(f'{magic}\n{X} {Y}\n{maxcolors}\n'.encode('ascii'))  # Writing PNM header to file
+    sample_count = 0  # Counting samples to break line <= 60 char
+    for row in list_3d:
+        # ↓ Flattening one row, skipping alpha
+        if Z == Z_READ:
+            row_1d = list(chain.from_iterable(row))
+        else:
+            row_1d = [pixel[z] for pixel in row for z in range(Z_READ)]
+        row_str = list(map(plain.__getitem__, row_1d))
+        # ↓ Every third sample in a file is preceded by break, 3 must fit any specs for line length
+        first = (2 - sample_count) % 3
+        row_str[first::3] = map(broken.__getitem__, row_1d[first::3])
+        sample_count += len(row_1d)
+        out_filename.write(''.join(row_str).encode('ascii'))  # Writing whole row to file
 
     return None
 # ↑ End of 'list2pnmascii' function writing ASCII PPM/PGM file
@@ -507,10 +1447,12 @@ def list2pnmascii(out_filename: str, list_3d: list[list[list[int]]], maxcolors:
     ║ list2pnm ║
     ╚══════════╝ """
 
-def list2pnm(out_filename: str, list_3d: list[list[list[int]]], maxcolors: int, bin: bool = True) -> None:
+def list2pnm(out_filename: str | PathLike | BinaryIO, list_3d: list[list[list[int]]], maxcolors: int, bin: bool = True) -> None:
     """Write PNM file using either ``list2pnmbin`` or ``list2pnmascii`` depending on ``bin`` switch.
 
-    :param str out_filename: name of the PNM file to be written;
+    :param out_filename: name of the PNM file to be written, or binary
+        file object (*e.g.* ``BytesIO``) to write to;
+    :type out_filename: str | PathLike | BinaryIO
     :param list_3d: image as list (image) of lists (rows) of lists (pixels)
         of ints (channels);
     :type list_3d: list[list[list[int]]]
@@ -51,6 +51,36 @@ where:
 .. note:: Function name **``scaleNx``** must contain capital **N**
     to avoid confusion with legacy file/module names.
 
+Result size, peak memory and time may be predicted before scaling
+(and even before reading pixel data) with::
+
+    from scalenx import estimate
+    X_new, Y_new, memory, seconds = estimate(X, Y, Z, bitdepth, n, sfx)
+
+where ``memory`` is expected peak memory of source and result
+nested lists, bytes, and ``seconds`` is expected scaling time.
+
+Optional ``engine`` argument of ``scaleNx`` selects implementation:
+
+- ``engine='list'``: conditional trees run for every pixel;
+- ``engine='sparse'``: conditional trees run only for pixels,
+  which neighbourhood may change something;
+- ``engine='auto'`` (default): the fastest engine for given image,
+  chosen by ``choose_engine(source_image, n, sfx)`` from share of
+  such pixels, estimated on a few dozen rows.
+
+All engines give identical results.
+
+Images too big to be held as nested list may be scaled
+with a few rows in memory::
+
+    from scalenx import scaleNx_rows
+    result_rows = scaleNx_rows(source_rows, n, sfx)
+
+where ``source_rows`` is any iterable of source rows (*e.g.* PyPNM
+``PnmImage.rows()`` or PyPNG ``png_rows``), and ``result_rows``
+is a generator of result rows, identical to ``scaleNx`` result rows.
+
 Compatibility info
 ------------------
 
@@ -117,18 +147,26 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2024-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '2026.2.16.16'
+__version__ = '2026.10.19.14'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
 
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
 from .scalenx import scale2x
 from .scalenx import scale3x
+from .scalenxcost import choose_engine, estimate
 from .scalenxsfx import scale2x as scale2xsfx
 from .scalenxsfx import scale3x as scale3xsfx
+from .scalenxsparse import scale2x as scale2xsparse
+from .scalenxsparse import scale2xsfx as scale2xsfxsparse
+from .scalenxsparse import scale3x as scale3xsparse
+from .scalenxsparse import scale3xsfx as scale3xsfxsparse
 
 
-def scaleNx(source_image: list[list[list[int]]], n: int, sfx: bool) -> list[list[list[int]]]:
+def scaleNx(source_image: list[list[list[int]]], n: int, sfx: bool, engine: str = 'auto') -> list[list[list[int]]]:
     """ScaleNx image rescaling, configurable via ``n`` and ``sfx`` options.
     ----
 
@@ -137,23 +175,75 @@ def scaleNx(source_image: list[list[list[int]]], n: int, sfx: bool) -> list[list
         channels order is LA or RGBA from 0 to top;
     :type source_image: list[list[list[int]]]
     :param int n: ``2`` or ``3``, choice between Scale2* and Scale3* methods;
-    :param bool sfx: choice between ScaleNx and ScaleNxSFX methods.
-    :raises ValueError: Attempt to use nonexistent method ``n``.
+    :param bool sfx: choice between ScaleNx and ScaleNxSFX methods;
+    :param str engine: ``'list'``, ``'sparse'`` or ``'auto'``;
+        all engines give identical results, differing in speed only.
+    :raises ValueError: Attempt to use nonexistent method ``n`` or ``engine``.
     :return: rescaled image os the same type as ``source_image``.
     :rtype: list[list[list[int]]]
 
     """
-    if sfx:
-        if n == 2:
-            return scale2xsfx(source_image)
-        elif n == 3:
-            return scale3xsfx(source_image)
+    if n not in (2, 3):
+        raise ValueError(f'Allowed ScaleNx{"SFX" if sfx else ""} methods are 2 and 3')
+
+    if engine == 'auto':
+        engine = choose_engine(source_image, n, sfx)
+
+    if engine == 'list':
+        if sfx:
+            return scale2xsfx(source_image) if n == 2 else scale3xsfx(source_image)
         else:
-            raise ValueError('Allowed ScaleNxSFX methods are 2 and 3')
-    else:
-        if n == 2:
-            return scale2x(source_image)
-        elif n == 3:
-            return scale3x(source_image)
+            return scale2x(source_image) if n == 2 else scale3x(source_image)
+    elif engine == 'sparse':
+        if sfx:
+            return scale2xsfxsparse(source_image) if n == 2 else scale3xsfxsparse(source_image)
         else:
-            raise ValueError('Allowed ScaleNx methods are 2 and 3')
+            return scale2xsparse(source_image) if n == 2 else scale3xsparse(source_image)
+    else:
+        raise ValueError(f'Unknown ScaleNx engine {engine}')
+
+
+def scaleNx_rows(source_rows: Iterable[list[list[int]]], n: int, sfx: bool, engine: str = 'auto', band: int = 64) -> Iterator[list[list[int]]]:
+    """ScaleNx image rescaling, taking and yielding rows one by one.
+    ----
+
+    Source is scaled in bands of ``band`` rows, each with context rows
+    above and below, so only about two bands of source and one band
+    of result are held in memory. Result rows are identical to ``scaleNx``
+    result rows; context rows scaled twice cost *ca.* ``4 / band`` extra time.
+
+    :param source_rows: iterable of source image rows, *i.e.*
+        lists (rows) of lists (pixels) of int (channel values);
+    :type source_rows: Iterable[list[list[int]]]
+    :param int n: ``2`` or ``3``, choice between Scale2* and Scale3* methods;
+    :param bool sfx: choice between ScaleNx and ScaleNxSFX methods;
+    :param str engine: ``'list'``, ``'sparse'`` or ``'auto'``, as for ``scaleNx``,
+        ``'auto'`` choosing engine per band;
+    :param int band: source rows scaled at once.
+    :raises ValueError: Attempt to use nonexistent method ``n`` or ``engine``.
+    :return: generator, yielding ``n`` times more rows than ``source_rows``,
+        each ``n`` times longer.
+    :rtype: Iterator[list[list[int]]]
+
+    """
+
+    if n not in (2, 3):
+        raise ValueError(f'Allowed ScaleNx{"SFX" if sfx else ""} methods are 2 and 3')
+    if engine not in ('list', 'sparse', 'auto'):
+        raise ValueError(f'Unknown ScaleNx engine {engine}')
+
+    # ↓ Result rows depend on source rows that far above and below
+    context = 2 if sfx else 1
+    band = max(band, context)
+
+    source_rows = iter(source_rows)
+    above: list[list[list[int]]] = []  # context rows preceding current band
+    current = list(islice(source_rows, band))
+    while current:
+        below = list(islice(source_rows, band))  # next band, also context for current
+        piece = above + current + below[:context]
+        scaled = scaleNx(piece, n, sfx, engine)
+        # ↓ Context rows are scaled for neighbourhood only, dropping them
+        yield from scaled[len(above) * n : (len(above) + len(current)) * n]
+        above = (above + current)[-context:]
+        current = below
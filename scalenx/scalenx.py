@@ -65,7 +65,7 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2024-2026 Ilya Razmanov'
 __credits__ = ['Andrea Mazzoleni', 'Ilya Razmanov']
 __license__ = 'unlicense'
-__version__ = '2026.2.16.16'
+__version__ = '2026.10.19.14'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
@@ -75,6 +75,23 @@ __status__ = 'Production'
     ╚════════════════════════════════════════════╝ """
 
 
+def _dva(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int]):
+    """Scale2x conditional tree function."""
+
+    r1 = r2 = r3 = r4 = E
+
+    if A != D and C != B:
+        if A == C:
+            r1 = C
+        if A == B:
+            r2 = B
+        if D == C:
+            r3 = C
+        if D == B:
+            r4 = B
+    return r1, r2, r3, r4
+
+
 def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     """Scale2x image rescale.
     ----
@@ -95,22 +112,6 @@ def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     # ↓ starting new image list
     scaled_image: list[list[list[int]]] = []
 
-    def _dva(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int]):
-        """Scale2x conditional tree function."""
-
-        r1 = r2 = r3 = r4 = E
-
-        if A != D and C != B:
-            if A == C:
-                r1 = C
-            if A == B:
-                r2 = B
-            if D == C:
-                r3 = C
-            if D == B:
-                r4 = B
-        return r1, r2, r3, r4
-
     """ Source around default pixel E
         ┌───┬───┬───┐
         │   │ A │   │
@@ -171,6 +172,32 @@ def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     ╚════════════════════════════════════════════╝ """
 
 
+def _tri(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int]):
+    """Scale3x conditional tree function."""
+
+    r1 = r2 = r3 = r4 = r5 = r6 = r7 = r8 = r9 = E
+
+    if B != H and D != F:
+        if D == B:
+            r1 = D
+        if (D == B and E != C) or (B == F and E != A):
+            r2 = B
+        if B == F:
+            r3 = F
+        if (D == B and E != G) or (D == H and E != A):
+            r4 = D
+        # central pixel r5 = E set already
+        if (B == F and E != I) or (H == F and E != C):
+            r6 = F
+        if D == H:
+            r7 = D
+        if (D == H and E != I) or (H == F and E != G):
+            r8 = H
+        if H == F:
+            r9 = F
+    return r1, r2, r3, r4, r5, r6, r7, r8, r9
+
+
 def scale3x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     """Scale3x image rescale.
     ----
@@ -191,31 +218,6 @@ def scale3x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     # ↓ starting new image list
     scaled_image: list[list[list[int]]] = []
 
-    def _tri(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int]):
-        """Scale3x conditional tree function."""
-
-        r1 = r2 = r3 = r4 = r5 = r6 = r7 = r8 = r9 = E
-
-        if B != H and D != F:
-            if D == B:
-                r1 = D
-            if (D == B and E != C) or (B == F and E != A):
-                r2 = B
-            if B == F:
-                r3 = F
-            if (D == B and E != G) or (D == H and E != A):
-                r4 = D
-            # central pixel r5 = E set already
-            if (B == F and E != I) or (H == F and E != C):
-                r6 = F
-            if D == H:
-                r7 = D
-            if (D == H and E != I) or (H == F and E != G):
-                r8 = H
-            if H == F:
-                r9 = F
-        return r1, r2, r3, r4, r5, r6, r7, r8, r9
-
     """ Source around default pixel E
         ┌───┬───┬───┐
         │ A │ B │ C │
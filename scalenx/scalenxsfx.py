@@ -63,7 +63,7 @@ __author__ = 'Ilya Razmanov'
 __copyright__ = '(c) 2025-2026 Ilya Razmanov'
 __credits__ = 'Ilya Razmanov'
 __license__ = 'unlicense'
-__version__ = '2026.2.16.16'
+__version__ = '2026.10.19.14'
 __maintainer__ = 'Ilya Razmanov'
 __email__ = 'ilyarazmanov@gmail.com'
 __status__ = 'Production'
@@ -73,6 +73,25 @@ __status__ = 'Production'
     ╚════════════════════════════════════════════╝ """
 
 
+def _dva(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int], J: list[int], K: list[int], L: list[int], M: list[int]):
+    """Scale2xSFX conditional tree function."""
+
+    r1 = r2 = r3 = r4 = E
+
+    if B != F and D != H:
+        if B == D and (A != E or C == E or E == G or A == J or A == K):
+            r1 = B
+        if H == F and (E != I or C == E or E == G or I == L or I == M):
+            r4 = H
+    if B != D and F != H:
+        if B == F and (C != E or A == E or E == I or C == J or C == L):
+            r2 = B
+        if H == D and (E != G or A == E or E == I or G == K or G == M):
+            r3 = H
+
+    return r1, r2, r3, r4
+
+
 def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     """Scale2xSFX image rescale.
     ----
@@ -93,24 +112,6 @@ def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     # ↓ starting new image list
     scaled_image: list[list[list[int]]] = []
 
-    def _dva(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int], J: list[int], K: list[int], L: list[int], M: list[int]):
-        """Scale2xSFX conditional tree function."""
-
-        r1 = r2 = r3 = r4 = E
-
-        if B != F and D != H:
-            if B == D and (A != E or C == E or E == G or A == J or A == K):
-                r1 = B
-            if H == F and (E != I or C == E or E == G or I == L or I == M):
-                r4 = H
-        if B != D and F != H:
-            if B == F and (C != E or A == E or E == I or C == J or C == L):
-                r2 = B
-            if H == D and (E != G or A == E or E == I or G == K or G == M):
-                r3 = H
-
-        return r1, r2, r3, r4
-
     """ Source around default pixel E
         ┌───┬───┬───┬───┬───┐
         │   │   │ J │   │   │
@@ -188,6 +189,66 @@ def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     ╚════════════════════════════════════════════╝ """
 
 
+def _tri(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int], J: list[int], K: list[int], L: list[int], M: list[int]):
+    """Scale3xSFX conditional tree function."""
+
+    r1 = r2 = r3 = r4 = r5 = r6 = r7 = r8 = r9 = E
+
+    if B == D:
+        if C == E and C != J and A != E:
+            r1 = B
+        elif E == G and A != E and G != K:
+            r1 = B
+        if B != F and D != H:
+            if A != E or C == E or E == G or A == J or A == K:
+                r1 = B
+            if C != E and (A != E or C == E or E == G or A == J or A == K):
+                r2 = B
+            if E != G and (A != E or C == E or E == G or A == J or A == K):
+                r4 = D
+
+    if B == F:
+        if A == E and A != J and C != E:
+            r3 = B
+        elif E == I and C != E and I != L:
+            r3 = B
+        if B != D and F != H:
+            if C != E or A == E or E == I or C == J or C == L:
+                r3 = B
+            if A != E and (C != E or A == E or E == I or C == J or C == L):
+                r2 = B
+            if E != I and (C != E or A == E or E == I or C == J or C == L):
+                r6 = F
+
+    if D == H:
+        if A == E and A != K and E != G:
+            r7 = H
+        elif E == I and E != G and I != M:
+            r7 = H
+        if B != D and F != H:
+            if E != G or A == E or E == I or G == K or G == M:
+                r7 = H
+            if A != E and (E != G or A == E or E == I or G == K or G == M):
+                r4 = D
+            if E != I and (E != G or A == E or E == I or G == K or G == M):
+                r8 = H
+
+    if F == H:
+        if C == E and C != L and E != I:
+            r9 = H
+        elif E == G and E != I and G != M:
+            r9 = H
+        if B != F and D != H:
+            if E != I or C == E or E == G or I == L or I == M:
+                r9 = H
+            if C != E and (E != I or C == E or E == G or I == L or I == M):
+                r6 = F
+            if E != G and (E != I or C == E or E == G or I == L or I == M):
+                r8 = H
+
+    return r1, r2, r3, r4, r5, r6, r7, r8, r9
+
+
 def scale3x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     """Scale3xSFX image rescale.
     ----
@@ -208,65 +269,6 @@ def scale3x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
     # ↓ starting new image list
     scaled_image: list[list[list[int]]] = []
 
-    def _tri(A: list[int], B: list[int], C: list[int], D: list[int], E: list[int], F: list[int], G: list[int], H: list[int], I: list[int], J: list[int], K: list[int], L: list[int], M: list[int]):
-        """Scale3xSFX conditional tree function."""
-
-        r1 = r2 = r3 = r4 = r5 = r6 = r7 = r8 = r9 = E
-
-        if B == D:
-            if C == E and C != J and A != E:
-                r1 = B
-            elif E == G and A != E and G != K:
-                r1 = B
-            if B != F and D != H:
-                if A != E or C == E or E == G or A == J or A == K:
-                    r1 = B
-                if C != E and (A != E or C == E or E == G or A == J or A == K):
-                    r2 = B
-                if E != G and (A != E or C == E or E == G or A == J or A == K):
-                    r4 = D
-
-        if B == F:
-            if A == E and A != J and C != E:
-                r3 = B
-            elif E == I and C != E and I != L:
-                r3 = B
-            if B != D and F != H:
-                if C != E or A == E or E == I or C == J or C == L:
-                    r3 = B
-                if A != E and (C != E or A == E or E == I or C == J or C == L):
-                    r2 = B
-                if E != I and (C != E or A == E or E == I or C == J or C == L):
-                    r6 = F
-
-        if D == H:
-            if A == E and A != K and E != G:
-                r7 = H
-            elif E == I and E != G and I != M:
-                r7 = H
-            if B != D and F != H:
-                if E != G or A == E or E == I or G == K or G == M:
-                    r7 = H
-                if A != E and (E != G or A == E or E == I or G == K or G == M):
-                    r4 = D
-                if E != I and (E != G or A == E or E == I or G == K or G == M):
-                    r8 = H
-
-        if F == H:
-            if C == E and C != L and E != I:
-                r9 = H
-            elif E == G and E != I and G != M:
-                r9 = H
-            if B != F and D != H:
-                if E != I or C == E or E == G or I == L or I == M:
-                    r9 = H
-                if C != E and (E != I or C == E or E == G or I == L or I == M):
-                    r6 = F
-                if E != G and (E != I or C == E or E == G or I == L or I == M):
-                    r8 = H
-
-        return r1, r2, r3, r4, r5, r6, r7, r8, r9
-
     """ Source around default pixel E
         ┌───┬───┬───┬───┬───┐
         │   │   │ J │   │   │
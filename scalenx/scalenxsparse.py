@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+"""
+=============
+ScaleNxSparse
+=============
+
+------------------------------------------------------------------------
+Scale2x, Scale3x, Scale2xSFX and Scale3xSFX image rescaling, sparse mode
+------------------------------------------------------------------------
+
+:Abstract: Current module comprise the same **Scale2x**, **Scale3x**,
+    **Scale2xSFX** and **Scale3xSFX** rescaling as ``scalenx`` and
+    ``scalenxsfx`` modules, giving identical results, but organized
+    differently for speed.
+
+    In every ScaleNx algorithm a pixel gets simply repeated
+    *n* x *n* times unless its neighbours differ in some specific way.
+    For pixel art, and for most other images, such "inactive" pixels
+    constitute an overwhelming majority.
+
+    Current implementation first compares whole rows with shifted
+    rows by means of ``map`` (*i.e.* at C level rather than with
+    Python loops), then fills result rows with repeated pixels,
+    also at C level, and finally runs conditional trees only for
+    pixels which neighbourhood may change something.
+
+Usage
+-----
+
+::
+
+    scaled_image = scalenxsparse.scale2x(source_image)
+
+and so on for ``scale3x``, ``scale2xsfx`` and ``scale3xsfx``, where:
+
+- ``source_image``: input image as list of lists (rows) of lists (pixels)
+        of int (channel values);
+- ``scaled_image``: output image as list of lists (rows) of lists (pixels)
+        of int (channel values).
+
+----
+`ScaleNx`_ explanations and illustrations page for current
+ScaleNx Python implementation.
+
+.. _ScaleNx: https://dnyarri.github.io/scalenx.html
+
+"""
+
+__author__ = 'Ilya Razmanov'
+__copyright__ = '(c) 2026 Ilya Razmanov'
+__credits__ = ['Andrea Mazzoleni', 'Ilya Razmanov']
+__license__ = 'unlicense'
+__version__ = '2026.10.19.14'
+__maintainer__ = 'Ilya Razmanov'
+__email__ = 'ilyarazmanov@gmail.com'
+__status__ = 'Production'
+
+from itertools import chain, compress
+from operator import eq
+
+from .scalenx import _dva as _dva_2x
+from .scalenx import _tri as _tri_3x
+from .scalenxsfx import _dva as _dva_2xsfx
+from .scalenxsfx import _tri as _tri_3xsfx
+
+""" ╔═════════════════╗
+    ║ Row comparisons ║
+    ╚═════════════════╝ """
+
+
+def _eq(row_a: list[list[int]], row_b: list[list[int]]) -> int:
+    """Compare two rows pixel by pixel.
+
+    :return: int, containing one byte per pixel, 1 if pixels are equal, 0 otherwise,
+        first pixel in the least significant byte.
+
+    """
+
+    return int.from_bytes(bytes(map(eq, row_a, row_b)), 'little')
+
+
+def _shift(row: list[list[int]]) -> tuple[list[list[int]], list[list[int]]]:
+    """Return left and right neighbours rows of ``row`` in "repeat edge" mode."""
+
+    left = row[:1] + row[:-1]
+    right = row[1:] + row[-1:]
+    return left, right
+
+
+""" ┌─────────────────────────────────────────────────────────────────┐
+    │ Active pixels masks. Arguments are rows of upper, left, center, │
+    │ right and lower neighbours, and mask with all pixels set.       │
+    │ Masks may include pixels not changed by conditional trees,      │
+    │ but never miss changed ones.                                    │
+    └─────────────────────────────────────────────────────────────────┘ """
+
+
+def _active_2x(up, left, center, right, down, ones: int) -> int:
+    """Scale2x: up != down and left != right, and at least one equality."""
+
+    active = (ones ^ _eq(up, down)) & (ones ^ _eq(left, right))
+    if active:
+        active &= _eq(up, left) | _eq(up, right) | _eq(down, left) | _eq(down, right)
+    return active
+
+
+def _active_3x(up, left, center, right, down, ones: int) -> int:
+    """Scale3x: conditions are the same as for Scale2x."""
+
+    return _active_2x(up, left, center, right, down, ones)
+
+
+def _active_2xsfx(up, left, center, right, down, ones: int) -> int:
+    """Scale2xSFX: (B != F and D != H) or (B != D and F != H), plus equalities."""
+
+    bf = _eq(up, right)
+    dh = _eq(left, down)
+    bd = _eq(up, left)
+    fh = _eq(right, down)
+    return ((ones ^ bf) & (ones ^ dh) & (bd | fh)) | ((ones ^ bd) & (ones ^ fh) & (bf | dh))
+
+
+def _active_3xsfx(up, left, center, right, down, ones: int) -> int:
+    """Scale3xSFX: any of B == D, B == F, D == H, F == H, unless all equal to E."""
+
+    active = _eq(up, left) | _eq(up, right) | _eq(left, down) | _eq(right, down)
+    if active:
+        active &= ones ^ (_eq(center, up) & _eq(center, left) & _eq(center, right) & _eq(center, down))
+    return active
+
+
+ACTIVE = {
+    (2, False): _active_2x,
+    (3, False): _active_3x,
+    (2, True): _active_2xsfx,
+    (3, True): _active_3xsfx,
+}
+
+
+def activity(image3d: list[list[list[int]]], n: int, sfx: bool, samples: int = 32) -> float:
+    """Estimate share of pixels, requiring conditional trees, from evenly spaced rows.
+    ----
+
+    :param image3d: source image 3D nested list;
+    :type image3d: list[list[list[int]]]
+    :param int n: ``2`` or ``3``, choice between Scale2* and Scale3* methods;
+    :param bool sfx: choice between ScaleNx and ScaleNxSFX methods;
+    :param int samples: maximum number of rows to examine.
+    :return: share of active pixels, from 0.0 to 1.0.
+    :rtype: float
+
+    """
+
+    Y, X = (len(image3d), len(image3d[0]))
+    ones = int.from_bytes(b'\x01' * X, 'little')
+    active_mask = ACTIVE[(n, bool(sfx))]
+
+    rows = range(0, Y, max(1, Y // samples))
+    active = 0
+    for y in rows:
+        row_e = image3d[y]
+        row_d, row_f = _shift(row_e)
+        active += active_mask(image3d[max(y - 1, 0)], row_d, row_e, row_f, image3d[min(y + 1, Y - 1)], ones).bit_count()
+
+    return active / (len(rows) * X)
+
+
+""" ╔════════════════════════════════════════════╗
+    ║ Scaling image nested list to 2x image list ║
+    ╚════════════════════════════════════════════╝ """
+
+
+def scale2x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
+    """Scale2x image rescale, sparse mode.
+    ----
+
+    :param image3d: 3D nested list (image) of lists (rows) of lists (pixels)
+        of int (channel values);
+    :type image3d: list[list[list[int]]]
+    :return: 3D nested list of the same structure as input,
+        rescaled in X and Y directions twice using Scale2x.
+    :rtype: list[list[list[int]]]
+
+    """
+
+    Y, X = (len(image3d), len(image3d[0]))
+    ones = int.from_bytes(b'\x01' * X, 'little')  # "True" for every pixel
+
+    scaled_image: list[list[list[int]]] = []
+
+    """ Letters as in ``scalenx.scale2x``
+        ┌───┬───┬───┐
+        │   │ A │   │
+        ├───┼───┼───┤
+        │ C │ E │ B │
+        ├───┼───┼───┤
+        │   │ D │   │
+        └───┴───┴───┘
+    """
+    for y in range(Y):
+        row_a = image3d[max(y - 1, 0)]
+        row_e = image3d[y]
+        row_d = image3d[min(y + 1, Y - 1)]
+        row_c, row_b = _shift(row_e)
+
+        # ↓ Default result: every pixel repeated
+        row_rez = list(chain.from_iterable(zip(row_e, row_e)))
+        row_dvo = row_rez.copy()
+
+        active = _active_2x(row_a, row_c, row_e, row_b, row_d, ones)
+        if active:
+            for x in compress(range(X), active.to_bytes(X, 'little')):
+                r1, r2, r3, r4 = _dva_2x(row_a[x], row_b[x], row_c[x], row_d[x], row_e[x])
+                row_rez[2 * x] = r1
+                row_rez[2 * x + 1] = r2
+                row_dvo[2 * x] = r3
+                row_dvo[2 * x + 1] = r4
+
+        scaled_image.append(row_rez)
+        scaled_image.append(row_dvo)
+
+    return scaled_image
+
+
+def scale2xsfx(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
+    """Scale2xSFX image rescale, sparse mode.
+    ----
+
+    :param image3d: 3D nested list (image) of lists (rows) of lists (pixels)
+        of int (channel values);
+    :type image3d: list[list[list[int]]]
+    :return: 3D nested list of the same structure as input,
+        rescaled in X and Y directions twice using Scale2xSFX.
+    :rtype: list[list[list[int]]]
+
+    """
+
+    Y, X = (len(image3d), len(image3d[0]))
+    ones = int.from_bytes(b'\x01' * X, 'little')
+
+    scaled_image: list[list[list[int]]] = []
+
+    """ Letters as in ``scalenxsfx.scale2x``
+        ┌───┬───┬───┬───┬───┐
+        │   │   │ J │   │   │
+        ├───┼───┼───┼───┼───┤
+        │   │ A │ B │ C │   │
+        ├───┼───┼───┼───┼───┤
+        │ K │ D │ E │ F │ L │
+        ├───┼───┼───┼───┼───┤
+        │   │ G │ H │ I │   │
+        ├───┼───┼───┼───┼───┤
+        │   │   │ M │   │   │
+        └───┴───┴───┴───┴───┘
+    """
+    for y in range(Y):
+        row_j = image3d[max(y - 2, 0)]
+        row_b = image3d[max(y - 1, 0)]
+        row_e = image3d[y]
+        row_h = image3d[min(y + 1, Y - 1)]
+        row_m = image3d[min(y + 2, Y - 1)]
+        row_d, row_f = _shift(row_e)
+
+        row_rez = list(chain.from_iterable(zip(row_e, row_e)))
+        row_dvo = row_rez.copy()
+
+        active = _active_2xsfx(row_b, row_d, row_e, row_f, row_h, ones)
+        if active:
+            for x in compress(range(X), active.to_bytes(X, 'little')):
+                x_1, x1 = max(x - 1, 0), min(x + 1, X - 1)
+                r1, r2, r3, r4 = _dva_2xsfx(
+                    row_b[x_1], row_b[x], row_b[x1],
+                    row_d[x], row_e[x], row_f[x],
+                    row_h[x_1], row_h[x], row_h[x1],
+                    row_j[x], row_e[max(x - 2, 0)], row_e[min(x + 2, X - 1)], row_m[x],
+                )  # fmt: skip
+                row_rez[2 * x] = r1
+                row_rez[2 * x + 1] = r2
+                row_dvo[2 * x] = r3
+                row_dvo[2 * x + 1] = r4
+
+        scaled_image.append(row_rez)
+        scaled_image.append(row_dvo)
+
+    return scaled_image
+
+
+""" ╔════════════════════════════════════════════╗
+    ║ Scaling image nested list to 3x image list ║
+    ╚════════════════════════════════════════════╝ """
+
+
+def scale3x(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
+    """Scale3x image rescale, sparse mode.
+    ----
+
+    :param image3d: 3D nested list (image) of lists (rows) of lists (pixels)
+        of int (channel values);
+    :type image3d: list[list[list[int]]]
+    :return: 3D nested list of the same structure as input,
+        rescaled in X and Y directions thrice using Scale3x.
+    :rtype: list[list[list[int]]]
+
+    """
+
+    Y, X = (len(image3d), len(image3d[0]))
+    ones = int.from_bytes(b'\x01' * X, 'little')
+
+    scaled_image: list[list[list[int]]] = []
+
+    """ Letters as in ``scalenx.scale3x``
+        ┌───┬───┬───┐
+        │ A │ B │ C │
+        ├───┼───┼───┤
+        │ D │ E │ F │
+        ├───┼───┼───┤
+        │ G │ H │ I │
+        └───┴───┴───┘
+    """
+    for y in range(Y):
+        row_b = image3d[max(y - 1, 0)]
+        row_e = image3d[y]
+        row_h = image3d[min(y + 1, Y - 1)]
+        row_d, row_f = _shift(row_e)
+
+        row_rez = list(chain.from_iterable(zip(row_e, row_e, row_e)))
+        row_dvo = row_rez.copy()
+        row_tre = row_rez.copy()
+
+        active = _active_3x(row_b, row_d, row_e, row_f, row_h, ones)
+        if active:
+            for x in compress(range(X), active.to_bytes(X, 'little')):
+                x_1, x1 = max(x - 1, 0), min(x + 1, X - 1)
+                r1, r2, r3, r4, r5, r6, r7, r8, r9 = _tri_3x(
+                    row_b[x_1], row_b[x], row_b[x1],
+                    row_d[x], row_e[x], row_f[x],
+                    row_h[x_1], row_h[x], row_h[x1],
+                )  # fmt: skip
+                row_rez[3 * x : 3 * x + 3] = r1, r2, r3
+                row_dvo[3 * x : 3 * x + 3] = r4, r5, r6
+                row_tre[3 * x : 3 * x + 3] = r7, r8, r9
+
+        scaled_image.append(row_rez)
+        scaled_image.append(row_dvo)
+        scaled_image.append(row_tre)
+
+    return scaled_image
+
+
+def scale3xsfx(image3d: list[list[list[int]]]) -> list[list[list[int]]]:
+    """Scale3xSFX image rescale, sparse mode.
+    ----
+
+    :param image3d: 3D nested list (image) of lists (rows) of lists (pixels)
+        of int (channel values);
+    :type image3d: list[list[list[int]]]
+    :return: 3D nested list of the same structure as input,
+        rescaled in X and Y directions thrice using Scale3xSFX.
+    :rtype: list[list[list[int]]]
+
+    """
+
+    Y, X = (len(image3d), len(image3d[0]))
+    ones = int.from_bytes(b'\x01' * X, 'little')
+
+    scaled_image: list[list[list[int]]] = []
+
+    """ Letters as in ``scalenxsfx.scale3x``, see ``scale2xsfx`` above. """
+    for y in range(Y):
+        row_j = image3d[max(y - 2, 0)]
+        row_b = image3d[max(y - 1, 0)]
+        row_e = image3d[y]
+        row_h = image3d[min(y + 1, Y - 1)]
+        row_m = image3d[min(y + 2, Y - 1)]
+        row_d, row_f = _shift(row_e)
+
+        row_rez = list(chain.from_iterable(zip(row_e, row_e, row_e)))
+        row_dvo = row_rez.copy()
+        row_tre = row_rez.copy()
+
+        active = _active_3xsfx(row_b, row_d, row_e, row_f, row_h, ones)
+        if active:
+            for x in compress(range(X), active.to_bytes(X, 'little')):
+                x_1, x1 = max(x - 1, 0), min(x + 1, X - 1)
+                r1, r2, r3, r4, r5, r6, r7, r8, r9 = _tri_3xsfx(
+                    row_b[x_1], row_b[x], row_b[x1],
+                    row_d[x], row_e[x], row_f[x],
+                    row_h[x_1], row_h[x], row_h[x1],
+                    row_j[x], row_e[max(x - 2, 0)], row_e[min(x + 2, X - 1)], row_m[x],
+                )  # fmt: skip
+                row_rez[3 * x : 3 * x + 3] = r1, r2, r3
+                row_dvo[3 * x : 3 * x + 3] = r4, r5, r6
+                row_tre[3 * x : 3 * x + 3] = r7, r8, r9
+
+        scaled_image.append(row_rez)
+        scaled_image.append(row_dvo)
+        scaled_image.append(row_tre)
+
+    return scaled_image
+
+
+# ↓ Dummy stub for standalone execution attempt
+if __name__ == '__main__':
+    print('Module to be imported, not run as standalone.')
+    need_help = input('Would you like to read some help (y/n)?')
+    if need_help.startswith(('y', 'Y')):
+        import scalenxsparse
+        help(scalenxsparse)